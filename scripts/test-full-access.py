@@ -162,7 +162,7 @@ def test_git_worktrees():
             worktree_path = Path(__file__).parent.parent / "worktrees" / "test-branch"
             if worktree_path.exists():
                 subprocess.run(
-                    ["git", "worktree", "remove", str(worktree_path)],
+                    ["git", "worktree", "remove", "--force", str(worktree_path)],
                     capture_output=True,
                 )
 
@@ -184,7 +184,7 @@ def test_git_worktrees():
 
                 # Cleanup
                 subprocess.run(
-                    ["git", "worktree", "remove", str(worktree_path)],
+                    ["git", "worktree", "remove", "--force", str(worktree_path)],
                     capture_output=True,
                 )
                 subprocess.run(
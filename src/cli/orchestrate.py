@@ -3,12 +3,13 @@
 Main CLI interface for the simplified agent orchestrator
 """
 
+import asyncio
 import click
+import functools
 import json
-import time
 from pathlib import Path
 import sys
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -16,11 +17,74 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.core.task_queue import TaskQueue, TaskStatus, Priority
 from src.core.agent_spawner import AgentSpawner, AgentType
 from src.core.context_manager import ContextManager
-from src.core.task_decomposer import TaskDecomposer
-from src.core.interactive_planner import InteractivePlanner, PlanningSession
-from src.core.feedback_orchestrator import FeedbackOrchestrator, SuccessCriteria
 from src.core.input_validator import InputValidator, ValidationError
 
+# Planner, decomposer and feedback modules are imported inside the commands
+# that use them, keeping startup light for status/agents/task/kill/cleanup
+if TYPE_CHECKING:
+    from src.core.interactive_planner import PlanningSession
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Optional faster event loop (not available on Windows)
+
+_PRIORITY_MAP = {
+    "high": Priority.HIGH,
+    "normal": Priority.NORMAL,
+    "low": Priority.LOW,
+}
+
+# How often process_tasks re-checks the queue while it could take more work,
+# and the upper bound on a wait when every agent slot is busy
+_IDLE_POLL_SECONDS = 2
+_SATURATED_WAIT_SECONDS = 30
+
+# Agent types in the order they are offered work ('any' tasks go to the first)
+_AGENT_TYPE_PREFERENCE = tuple(agent_type.value for agent_type in AgentType)
+_AGENT_TYPES_BY_VALUE = {agent_type.value: agent_type for agent_type in AgentType}
+
+# Metrics accepted for range criteria in submit-validated; click re-prompts
+# on anything else instead of storing a misspelled metric
+_RANGE_METRIC_CHOICE = click.Choice(
+    ["accuracy", "precision", "recall", "f1"], case_sensitive=False
+)
+
+# Options shown on every pass of the interactive planning loop
+_PLAN_MENU = "\n".join(
+    [
+        "\n📋 Planning Options:",
+        "  [d] Discuss approach with Claude",
+        "  [a] Add a new task",
+        "  [r] Remove a task",
+        "  [m] Modify a task",
+        "  [s] Split a task into subtasks",
+        "  [o] Reorder tasks",
+        "  [v] View detailed plan",
+        "  [p] Proceed to approval",
+        "  [q] Quit without saving",
+        "  [save] Save session for later",
+    ]
+)
+
+
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    # Python 3.12+: coroutines that finish without suspending skip the
+    # Task scheduling round trip
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
 
 class Orchestrator:
     """Main orchestrator that coordinates everything"""
@@ -33,14 +97,10 @@ class Orchestrator:
         self.context = ContextManager(f"{base_dir}/context")
         self.running = False
 
-    def submit_task(
-        self,
-        description: str,
-        agent_type: str = "any",
-        priority: str = "normal",
-        context: Dict = None,
-    ) -> str:
-        """Submit a new task with input validation"""
+    def _validate_submission(
+        self, description: str, agent_type: str, priority: str, context: Dict
+    ) -> Tuple[str, str, Priority]:
+        """Validate and sanitize a task submission"""
         try:
             # Validate and sanitize inputs
             safe_description = InputValidator.sanitize_task_description(description)
@@ -57,26 +117,66 @@ class Orchestrator:
         except ValidationError as e:
             raise ValueError(f"Invalid input: {e}")
 
-        priority_map = {
-            "high": Priority.HIGH,
-            "normal": Priority.NORMAL,
-            "low": Priority.LOW,
-        }
+        return (
+            safe_description,
+            safe_agent_type,
+            _PRIORITY_MAP.get(safe_priority, Priority.NORMAL),
+        )
+
+    def submit_task(
+        self,
+        description: str,
+        agent_type: str = "any",
+        priority: str = "normal",
+        context: Dict = None,
+    ) -> str:
+        """Submit a new task with input validation"""
+        safe_description, safe_agent_type, safe_priority = self._validate_submission(
+            description, agent_type, priority, context
+        )
 
         task_id = self.queue.add_task(
             description=safe_description,
             agent_type=safe_agent_type,
-            priority=priority_map.get(safe_priority, Priority.NORMAL),
+            priority=safe_priority,
             context=context,
         )
 
         if context:
-            self.context.set_task_context(task_id, context)
+            # Already validated by _validate_submission()
+            self.context.set_task_context(task_id, context, validate=False)
 
         return task_id
 
+    def submit_tasks(
+        self, tasks: List[Tuple[str, str, str, Optional[Dict]]]
+    ) -> List[str]:
+        """Validate and submit many (description, agent_type, priority, context) tasks.
+
+        All tasks are validated before any are queued, and the inserts share a
+        single transaction.
+        """
+        validated = [
+            (
+                *self._validate_submission(description, agent_type, priority, context),
+                context,
+            )
+            for description, agent_type, priority, context in tasks
+        ]
+        task_ids = self.queue.add_tasks(validated)
+
+        for task_id, (_, _, _, context) in zip(task_ids, validated):
+            if context:
+                self.context.set_task_context(task_id, context, validate=False)
+
+        return task_ids
+
     def process_tasks(self, max_agents: int = 3):
         """Process tasks from queue"""
+        _run_async(self.process_tasks_async(max_agents))
+
+    async def process_tasks_async(self, max_agents: int = 3):
+        """Process tasks from queue, waking as soon as any agent exits"""
         existing_agents = [agent for agent in self.spawner.get_all_agents() if agent]
         active_agent_ids = {agent["agent_id"] for agent in existing_agents}
         requeued = self.queue.requeue_orphaned_tasks(
@@ -86,79 +186,105 @@ class Orchestrator:
         if requeued:
             click.echo(f"♻️  Requeued {requeued} orphaned tasks")
 
-        active_agents = []
+        # Exit future -> agent_id for every agent we are waiting on
+        active_agents: Dict[asyncio.Future, str] = {}
 
         while True:
-            # Clean up completed agents
-            for agent_id in list(active_agents):
-                status = self.spawner.get_agent_status(agent_id)
-                if status and not status["running"]:
-                    # Get output and update task
-                    output = self.spawner.get_agent_output(agent_id)
-                    task_id = status["task_id"]
-
-                    if output:
-                        self.context.add_agent_output(agent_id, task_id, output)
-
-                    # Update task status
-                    if status["status"] == "completed":
-                        self.queue.update_status(
-                            task_id, TaskStatus.COMPLETED, result=output
+            # Spawn new agents if under limit; their task rows are updated
+            # together once this round of spawning is done
+            started = []
+            # One query per tick tells us whether there is any work at all
+            pending = self.queue.pending_counts()
+            free_slots = max_agents - len(active_agents)
+            if free_slots > 0 and any(pending.values()):
+                # Claim up to one task per free slot in a single query
+                batch = self.queue.pick_next_batch(free_slots, _AGENT_TYPE_PREFERENCE)
+                # Spawning writes files and forks, so run the batch concurrently
+                # in worker threads rather than one after another on the loop
+                loop = asyncio.get_running_loop()
+                spawn_results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            None,
+                            functools.partial(
+                                self.spawner.spawn_agent,
+                                agent_type=_AGENT_TYPES_BY_VALUE[agent_type_str],
+                                task_id=task.id,
+                                task_description=task.description,
+                                context=task.context,
+                            ),
                         )
-                        click.echo(f"✅ Task {task_id} completed by {agent_id}")
-                    else:
-                        self.queue.update_status(
-                            task_id, TaskStatus.FAILED, error="Agent failed"
+                        for task, agent_type_str in batch
+                    ),
+                    return_exceptions=True,
+                )
+
+                spawn_failures = []
+                for (task, _), agent_id in zip(batch, spawn_results):
+                    if isinstance(agent_id, BaseException):
+                        # Return task to queue and record failure reason
+                        spawn_failures.append((task.id, f"Spawn failed: {agent_id}"))
+                        click.echo(
+                            f"❌ Failed to spawn agent for task {task.id}: {agent_id}",
+                            err=True,
                         )
-                        click.echo(f"❌ Task {task_id} failed on {agent_id}")
-
-                    active_agents.remove(agent_id)
-
-            # Spawn new agents if under limit
-            while len(active_agents) < max_agents:
-                # Try each agent type
-                for agent_type_enum in AgentType:
-                    agent_type_str = agent_type_enum.value
-                    task = self.queue.get_next_task(agent_type_str)
-                    if task:
-                        # Assign and spawn using the requested agent type
-                        if self.queue.assign_task(task.id, f"{agent_type_str}-agent"):
-                            try:
-                                agent_id = self.spawner.spawn_agent(
-                                    agent_type=agent_type_enum,
-                                    task_id=task.id,
-                                    task_description=task.description,
-                                    context=task.context,
-                                )
-                            except Exception as exc:
-                                # Return task to queue and record failure reason
-                                self.queue.update_status(
-                                    task.id,
-                                    TaskStatus.PENDING,
-                                    error=f"Spawn failed: {exc}",
-                                )
-                                click.echo(
-                                    f"❌ Failed to spawn agent for task {task.id}: {exc}",
-                                    err=True,
-                                )
-                                continue
-
-                            self.queue.update_assigned_agent(task.id, agent_id)
-                            self.queue.update_status(task.id, TaskStatus.IN_PROGRESS)
-
-                            active_agents.append(agent_id)
-                            click.echo(f"🚀 Spawned {agent_id} for task {task.id}")
-                            break
-                else:
-                    # No more tasks for any agent type
-                    break
+                        continue
+
+                    started.append((task.id, agent_id))
+                    pending[task.agent_type] = pending.get(task.agent_type, 1) - 1
+                    active_agents[self.spawner.wait_for_exit(agent_id)] = agent_id
+                    click.echo(f"🚀 Spawned {agent_id} for task {task.id}")
+
+                self.queue.requeue_tasks(spawn_failures)
+
+            if started:
+                self.queue.start_tasks(started)
 
             # Check if we're done
-            if not active_agents and not self.queue.get_next_task():
+            if not active_agents and not any(pending.values()):
                 break
 
-            # Wait a bit before next iteration
-            time.sleep(2)
+            # Wait for an agent to exit. With spare capacity, re-check the queue
+            # every 2s for new work; at capacity nothing can be spawned until an
+            # exit wakes us, so only a long safety timeout applies.
+            if active_agents:
+                timeout = (
+                    _IDLE_POLL_SECONDS
+                    if len(active_agents) < max_agents
+                    else _SATURATED_WAIT_SECONDS
+                )
+                done, _ = await asyncio.wait(
+                    active_agents, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+            else:
+                done = set()
+                await asyncio.sleep(_IDLE_POLL_SECONDS)
+
+            # Clean up completed agents, committing their task updates together
+            finished = []
+            for future in done:
+                agent_id = active_agents.pop(future)
+                status = self.spawner.get_agent_status(agent_id)
+                if not status:
+                    continue
+
+                # Get output and update task
+                output = self.spawner.get_agent_output(agent_id)
+                task_id = status["task_id"]
+
+                if output:
+                    self.context.add_agent_output(agent_id, task_id, output)
+
+                # Update task status
+                if status["status"] == "completed":
+                    finished.append((task_id, TaskStatus.COMPLETED, output, None))
+                    click.echo(f"✅ Task {task_id} completed by {agent_id}")
+                else:
+                    finished.append((task_id, TaskStatus.FAILED, None, "Agent failed"))
+                    click.echo(f"❌ Task {task_id} failed on {agent_id}")
+
+            if finished:
+                self.queue.update_statuses(finished)
 
         click.echo("✨ All tasks completed!")
 
@@ -166,6 +292,16 @@ class Orchestrator:
 
 
 
+@functools.lru_cache(maxsize=1)
+def get_orchestrator() -> Orchestrator:
+    """Get the process-wide Orchestrator, creating it on first use.
+
+    Sharing one instance keeps a single TaskQueue, AgentSpawner (and its
+    cleanup thread) and ContextManager per process.
+    """
+    return Orchestrator()
+
+
 @click.group()
 def cli():
     """Simple Agent Orchestrator - Manage multiple CLI agents"""
@@ -210,7 +346,7 @@ def daemon(task_description):
 )
 def submit(description, agent, priority, context, decompose):
     """Submit a new task to the queue"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     # Validate inputs first
     try:
@@ -238,6 +374,8 @@ def submit(description, agent, priority, context, decompose):
 
     try:
         if decompose:
+            from src.core.task_decomposer import TaskDecomposer
+
             # Decompose the task into subtasks
             click.echo(f"🔍 Decomposing task: {description}")
             decomposer = TaskDecomposer()
@@ -248,23 +386,27 @@ def submit(description, agent, priority, context, decompose):
                 return
 
             click.echo(f"📝 Created {len(subtasks)} subtasks:")
-            task_ids = []
-            for i, subtask in enumerate(subtasks, 1):
-                # Create safe subtask context
-                subtask_context = {
-                    "parent_task": description[:100],  # Limit length
-                    "subtask_index": i,
-                }
-                task_id = orchestrator.submit_task(
-                    subtask.description,
-                    subtask.agent_type,
-                    priority,
-                    subtask_context,
-                )
-                task_ids.append(task_id)
-                click.echo(
+            task_ids = orchestrator.submit_tasks(
+                [
+                    (
+                        subtask.description,
+                        subtask.agent_type,
+                        priority,
+                        # Create safe subtask context
+                        {
+                            "parent_task": description[:100],  # Limit length
+                            "subtask_index": i,
+                        },
+                    )
+                    for i, subtask in enumerate(subtasks, 1)
+                ]
+            )
+            click.echo(
+                "\n".join(
                     f"  {i}. [{subtask.agent_type}] {subtask.description} - {task_id}"
+                    for i, (subtask, task_id) in enumerate(zip(subtasks, task_ids), 1)
                 )
+            )
 
             click.echo(f"✅ Submitted {len(task_ids)} subtasks")
         else:
@@ -285,6 +427,7 @@ def submit(description, agent, priority, context, decompose):
 def autonomous(task_description, steps):
     """Run an autonomous agent task loop"""
     from src.core.agent_api import AgentAPI
+    from src.core.autonomous_harness import AutonomousHarness
 
     click.echo(f"🤖 Starting Autonomous Agent for: {task_description}")
     
@@ -307,6 +450,8 @@ def autonomous(task_description, steps):
         click.echo("\n⚠️ Interrupted by user")
     except Exception as e:
         click.echo(f"\n❌ Error: {e}", err=True)
+    finally:
+        harness.close()
 
 
 @cli.command("autonomous-parallel")
@@ -375,6 +520,8 @@ def autonomous_parallel(task_description, subtasks, steps, parallel_agents):
         click.echo("\n⚠️ Interrupted by user")
     except Exception as e:
         click.echo(f"\n❌ Error: {e}", err=True)
+    finally:
+        harness.close()
 
 
 @cli.command("execute-parallel")
@@ -496,7 +643,7 @@ def pool_status():
 @cli.command()
 @click.option("--max-agents", "-m", default=3, help="Maximum concurrent agents")
 def run(max_agents):
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     click.echo(f"🎯 Starting orchestrator with max {max_agents} agents...")
     click.echo("Press Ctrl+C to stop\n")
@@ -511,36 +658,41 @@ def run(max_agents):
 @cli.command()
 def status():
     """Show status of all tasks and agents"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
+
+    # Collect output and emit it with a single write
+    lines = []
 
     # Show queue stats
     stats = orchestrator.queue.get_stats()
-    click.echo("📊 Task Queue Status:")
+    lines.append("📊 Task Queue Status:")
     for status, count in stats.items():
         if count > 0:
-            click.echo(f"  {status}: {count}")
+            lines.append(f"  {status}: {count}")
 
     # Show running agents
     agents = orchestrator.spawner.get_all_agents()
     if agents:
-        click.echo("\n🤖 Active Agents:")
+        lines.append("\n🤖 Active Agents:")
         for agent in agents:
-            click.echo(
+            lines.append(
                 f"  {agent['agent_id']}: {agent['status']} (Task: {agent['task_id']})"
             )
 
     # Show recent tasks
-    click.echo("\n📝 Recent Tasks:")
-    tasks = orchestrator.queue.get_all_tasks()[:5]
-    for task in tasks:
-        click.echo(f"  [{task.id}] {task.description[:50]}... - {task.status}")
+    lines.append("\n📝 Recent Tasks:")
+    recent = orchestrator.queue.get_recent_tasks_summary(5)
+    for task_id, description, task_status in recent:
+        lines.append(f"  [{task_id}] {description}... - {task_status}")
+
+    click.echo("\n".join(lines))
 
 
 @cli.command()
 @click.argument("task_id")
 def task(task_id):
     """Show details of a specific task"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     task = orchestrator.queue.get_task(task_id)
     if not task:
@@ -573,28 +725,29 @@ def task(task_id):
 @cli.command()
 def agents():
     """List all active agents"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     agents = orchestrator.spawner.get_all_agents()
     if not agents:
         click.echo("No active agents")
         return
 
-    click.echo("🤖 Active Agents:")
+    lines = ["🤖 Active Agents:"]
     for agent in agents:
         status_icon = "🟢" if agent["running"] else "🔴"
-        click.echo(f"{status_icon} {agent['agent_id']}")
-        click.echo(f"   Type: {agent['agent_type']}")
-        click.echo(f"   Task: {agent['task_id']}")
-        click.echo(f"   Status: {agent['status']}")
-        click.echo(f"   Duration: {agent['duration']:.1f}s")
+        lines.append(f"{status_icon} {agent['agent_id']}")
+        lines.append(f"   Type: {agent['agent_type']}")
+        lines.append(f"   Task: {agent['task_id']}")
+        lines.append(f"   Status: {agent['status']}")
+        lines.append(f"   Duration: {agent['duration']:.1f}s")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
 @click.argument("agent_id")
 def kill(agent_id):
     """Kill a running agent"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     if orchestrator.spawner.kill_agent(agent_id):
         click.echo(f"✅ Killed agent {agent_id}")
@@ -605,7 +758,7 @@ def kill(agent_id):
 @cli.command()
 def cleanup():
     """Clean up all agents and old tasks"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     # Clean up agents
     orchestrator.spawner.cleanup_all()
@@ -623,7 +776,7 @@ def cleanup():
 @cli.command()
 def demo():
     """Run a demo with sample tasks"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     click.echo("🎭 Running demo with sample tasks...")
 
@@ -634,21 +787,26 @@ def demo():
         ("Explain the difference between TCP and UDP", "any", "low"),
     ]
 
-    task_ids = []
-    for desc, agent, priority in tasks:
-        task_id = orchestrator.submit_task(desc, agent, priority)
-        task_ids.append(task_id)
-        click.echo(f"  Submitted: {task_id} - {desc[:40]}...")
+    task_ids = orchestrator.submit_tasks(
+        [(desc, agent, priority, None) for desc, agent, priority in tasks]
+    )
+    click.echo(
+        "\n".join(
+            f"  Submitted: {task_id} - {desc[:40]}..."
+            for task_id, (desc, _, _) in zip(task_ids, tasks)
+        )
+    )
 
     click.echo("\n🚀 Processing tasks...")
     orchestrator.process_tasks(max_agents=2)
 
-    click.echo("\n📊 Results:")
+    lines = ["\n📊 Results:"]
     for task_id in task_ids:
         task = orchestrator.queue.get_task(task_id)
         if task:
             status_icon = "✅" if task.status == "completed" else "❌"
-            click.echo(f"  {status_icon} {task_id}: {task.status}")
+            lines.append(f"  {status_icon} {task_id}: {task.status}")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -656,6 +814,8 @@ def demo():
 @click.option("--context", "-c", help="JSON context for the planning session")
 def plan(description, context):
     """Start an interactive planning session with the head node"""
+    from src.core.interactive_planner import InteractivePlanner
+
     planner = InteractivePlanner()
 
     # Validate description first
@@ -695,19 +855,11 @@ def plan(description, context):
         click.echo("\n" + "─" * 70)
 
         # Show options
-        click.echo("\n📋 Planning Options:")
-        click.echo("  [d] Discuss approach with Claude")
-        click.echo("  [a] Add a new task")
-        click.echo("  [r] Remove a task")
-        click.echo("  [m] Modify a task")
-        click.echo("  [s] Split a task into subtasks")
-        click.echo("  [o] Reorder tasks")
-        click.echo("  [v] View detailed plan")
-        click.echo("  [p] Proceed to approval")
-        click.echo("  [q] Quit without saving")
-        click.echo("  [save] Save session for later")
+        click.echo(_PLAN_MENU)
 
         choice = click.prompt("\nYour choice", type=str).lower().strip()
+        subtasks = session.subtasks
+        n = len(subtasks)
 
         if choice == "d":
             # Discuss with Claude
@@ -748,7 +900,7 @@ def plan(description, context):
                 continue
 
             if position == -1:
-                position = len(session.subtasks)
+                position = n
 
             session = planner.refine_plan(
                 session,
@@ -763,10 +915,11 @@ def plan(description, context):
 
         elif choice == "r":
             # Remove task
-            for i, task in enumerate(session.subtasks):
-                click.echo(f"{i}. [{task.agent_type}] {task.description}")
+            click.echo(_format_subtask_list(subtasks))
 
             task_index = click.prompt("\nTask number to remove", type=int)
+            if not _valid_index(task_index, n):
+                continue
             session = planner.refine_plan(
                 session, "remove_task", {"task_index": task_index}
             )
@@ -774,40 +927,41 @@ def plan(description, context):
 
         elif choice == "m":
             # Modify task
-            for i, task in enumerate(session.subtasks):
-                click.echo(f"{i}. [{task.agent_type}] {task.description}")
+            click.echo(_format_subtask_list(subtasks))
 
             task_index = click.prompt("\nTask number to modify", type=int)
+            if not _valid_index(task_index, n):
+                continue
 
-            if 0 <= task_index < len(session.subtasks):
-                current_task = session.subtasks[task_index]
-                click.echo(f"\nCurrent: {current_task.description}")
-                new_desc = click.prompt(
-                    "New description (Enter to keep current)",
-                    default=current_task.description,
-                )
-                new_agent = click.prompt(
-                    "New agent type (Enter to keep current)",
-                    default=current_task.agent_type,
-                )
+            current_task = subtasks[task_index]
+            click.echo(f"\nCurrent: {current_task.description}")
+            new_desc = click.prompt(
+                "New description (Enter to keep current)",
+                default=current_task.description,
+            )
+            new_agent = click.prompt(
+                "New agent type (Enter to keep current)",
+                default=current_task.agent_type,
+            )
 
-                session = planner.refine_plan(
-                    session,
-                    "modify_task",
-                    {
-                        "task_index": task_index,
-                        "description": new_desc,
-                        "agent_type": new_agent,
-                    },
-                )
-                click.echo("✅ Task modified")
+            session = planner.refine_plan(
+                session,
+                "modify_task",
+                {
+                    "task_index": task_index,
+                    "description": new_desc,
+                    "agent_type": new_agent,
+                },
+            )
+            click.echo("✅ Task modified")
 
         elif choice == "s":
             # Split task
-            for i, task in enumerate(session.subtasks):
-                click.echo(f"{i}. [{task.agent_type}] {task.description}")
+            click.echo(_format_subtask_list(subtasks))
 
             task_index = click.prompt("\nTask number to split", type=int)
+            if not _valid_index(task_index, n):
+                continue
             split_count = click.prompt(
                 "Split into how many tasks?", type=int, default=2
             )
@@ -821,11 +975,14 @@ def plan(description, context):
 
         elif choice == "o":
             # Reorder tasks
-            for i, task in enumerate(session.subtasks):
-                click.echo(f"{i}. [{task.agent_type}] {task.description}")
+            click.echo(_format_subtask_list(subtasks))
 
             old_index = click.prompt("\nTask to move", type=int)
+            if not _valid_index(old_index, n):
+                continue
             new_index = click.prompt("Move to position", type=int)
+            if not _valid_index(new_index, n):
+                continue
 
             session = planner.refine_plan(
                 session, "reorder", {"old_index": old_index, "new_index": new_index}
@@ -881,10 +1038,28 @@ def plan(description, context):
             click.echo("❌ Invalid choice. Please try again.")
 
 
+def _format_subtask_list(subtasks) -> str:
+    """Render numbered plan tasks for the pick-a-task prompts"""
+    return "\n".join(
+        f"{i}. [{task.agent_type}] {task.description}"
+        for i, task in enumerate(subtasks)
+    )
+
+
+def _valid_index(task_index: int, n: int) -> bool:
+    """Check a plan task number against the number of tasks, reporting misses"""
+    if 0 <= task_index < n:
+        return True
+    click.echo(f"❌ Invalid task number: {task_index}", err=True)
+    return False
+
+
 @cli.command()
 @click.argument("session_id")
 def plan_continue(session_id):
     """Continue an existing planning session"""
+    from src.core.interactive_planner import InteractivePlanner
+
     planner = InteractivePlanner()
 
     session = planner.load_session(session_id)
@@ -913,6 +1088,8 @@ def plan_continue(session_id):
 @click.argument("session_id")
 def execute_plan(session_id):
     """Execute an approved plan from a planning session"""
+    from src.core.interactive_planner import InteractivePlanner
+
     planner = InteractivePlanner()
 
     session = planner.load_session(session_id)
@@ -931,6 +1108,8 @@ def execute_plan(session_id):
 @cli.command()
 def plan_list():
     """List all planning sessions"""
+    from src.core.interactive_planner import InteractivePlanner
+
     planner = InteractivePlanner()
 
     sessions = planner.list_sessions()
@@ -938,56 +1117,57 @@ def plan_list():
         click.echo("No planning sessions found")
         return
 
-    click.echo("\n📋 Planning Sessions:")
-    click.echo("=" * 80)
+    lines = ["\n📋 Planning Sessions:", "=" * 80]
 
     for session in sessions:
         status_icon = {"planning": "🔄", "approved": "✅", "executed": "🚀"}.get(
             session["status"], "❓"
         )
 
-        click.echo(f"\n{status_icon} {session['session_id']}")
-        click.echo(f"   Goal: {session['goal'][:60]}...")
-        click.echo(f"   Created: {session['created_at']}")
-        click.echo(f"   Tasks: {session['task_count']}")
-        click.echo(f"   Status: {session['status']}")
+        lines.append(f"\n{status_icon} {session['session_id']}")
+        lines.append(f"   Goal: {session['goal'][:60]}...")
+        lines.append(f"   Created: {session['created_at']}")
+        lines.append(f"   Tasks: {session['task_count']}")
+        lines.append(f"   Status: {session['status']}")
 
-    click.echo("\n" + "=" * 80)
-    click.echo("Use './orchestrate plan-continue <session-id>' to resume planning")
-    click.echo(
+    lines.append("\n" + "=" * 80)
+    lines.append("Use './orchestrate plan-continue <session-id>' to resume planning")
+    lines.append(
         "Use './orchestrate execute-plan <session-id>' to execute approved plans"
     )
+    click.echo("\n".join(lines))
 
 
-def _execute_plan_from_session(session: PlanningSession):
+def _execute_plan_from_session(session: "PlanningSession"):
     """Helper function to execute tasks from a planning session"""
-    orchestrator = Orchestrator()
+    orchestrator = get_orchestrator()
 
     click.echo("\n🚀 Executing planned tasks...")
     click.echo("=" * 70)
 
-    # Submit all tasks from the plan
-    task_ids = []
+    # Submit all tasks from the plan in one batch
+    total_subtasks = len(session.subtasks)
+    submissions = []
     for i, subtask in enumerate(session.subtasks, 1):
         context = {
             "planning_session": session.session_id,
             "parent_goal": session.goal,
             "subtask_index": i,
-            "total_subtasks": len(session.subtasks),
+            "total_subtasks": total_subtasks,
         }
 
         if subtask.context_needed:
             context["context_needed"] = subtask.context_needed
 
-        task_id = orchestrator.submit_task(
-            subtask.description, subtask.agent_type, "normal", context
-        )
-        task_ids.append(task_id)
-        click.echo(
-            f"  ✅ Submitted: [{subtask.agent_type}] {subtask.description[:50]}..."
-        )
+        submissions.append((subtask.description, subtask.agent_type, "normal", context))
 
-    click.echo(f"\n📊 Submitted {len(task_ids)} tasks from plan")
+    task_ids = orchestrator.submit_tasks(submissions)
+    lines = [
+        f"  ✅ Submitted: [{subtask.agent_type}] {subtask.description[:50]}..."
+        for subtask in session.subtasks
+    ]
+    lines.append(f"\n📊 Submitted {len(task_ids)} tasks from plan")
+    click.echo("\n".join(lines))
 
     # Ask if they want to start processing immediately
     if click.confirm("\n🎯 Start processing tasks now?"):
@@ -1041,7 +1221,7 @@ def web(port, debug, enhanced):
 @click.option(
     "--criteria-type",
     "-ct",
-    type=click.Choice(["threshold", "range", "multi_objective"]),
+    type=click.Choice(["threshold", "range", "multi_objective"], case_sensitive=False),
     default="threshold",
 )
 @click.option(
@@ -1062,6 +1242,8 @@ def submit_validated(
     description, criteria_type, domain, agent, max_iterations, strategy
 ):
     """Submit a task with success validation and feedback loop"""
+    from src.core.feedback_orchestrator import FeedbackOrchestrator, SuccessCriteria
+
     click.echo("🎯 Setting up success criteria...")
 
     criteria_params = {}
@@ -1098,7 +1280,9 @@ def submit_validated(
                 criteria_desc += f", F1 > {f1_target}"
 
         elif criteria_type == "range":
-            metric = click.prompt("Metric name (accuracy/precision/recall/f1)")
+            metric = click.prompt(
+                "Metric name", type=_RANGE_METRIC_CHOICE, show_choices=True
+            )
             min_val = click.prompt("Minimum value", type=float)
             max_val = click.prompt("Maximum value", type=float)
             criteria_params[metric] = {"min": min_val, "max": max_val}
@@ -1135,23 +1319,31 @@ def submit_validated(
     if click.confirm("\n🚀 Start feedback loop now?"):
         click.echo("\n" + "=" * 50)
         results = orchestrator.process_feedback_loop(task.task_id)
-
-        click.echo("\n" + "=" * 50)
-        click.echo("📊 Final Results:")
-        click.echo(f"Iterations: {results['iterations']}")
-        click.echo(f"Status: {results['final_status']}")
-
-        for result in results["results"]:
-            click.echo(f"\nIteration {result['iteration']}: {result['evaluation']}")
-            click.echo(f"Metrics: {json.dumps(result['metrics'], indent=2)}")
+        click.echo(_format_feedback_results(results))
     else:
         click.echo(f"\nRun later: ./orchestrate feedback-run {task.task_id}")
 
 
+def _format_feedback_results(results: Dict) -> str:
+    """Render a process_feedback_loop() result for a single write"""
+    lines = [
+        "\n" + "=" * 50,
+        "📊 Final Results:",
+        f"Iterations: {results['iterations']}",
+        f"Status: {results['final_status']}",
+    ]
+    for result in results["results"]:
+        lines.append(f"\nIteration {result['iteration']}: {result['evaluation']}")
+        lines.append(f"Metrics: {json.dumps(result['metrics'], indent=2)}")
+    return "\n".join(lines)
+
+
 @cli.command("feedback-run")
 @click.argument("task_id")
 def feedback_run(task_id):
     """Run feedback loop for a validated task"""
+    from src.core.feedback_orchestrator import FeedbackOrchestrator
+
     orchestrator = FeedbackOrchestrator()
 
     click.echo(f"🔄 Starting feedback loop for task {task_id}")
@@ -1161,20 +1353,15 @@ def feedback_run(task_id):
         click.echo(f"❌ {results['error']}", err=True)
         return
 
-    click.echo("\n" + "=" * 50)
-    click.echo("📊 Final Results:")
-    click.echo(f"Iterations: {results['iterations']}")
-    click.echo(f"Status: {results['final_status']}")
-
-    for result in results["results"]:
-        click.echo(f"\nIteration {result['iteration']}: {result['evaluation']}")
-        click.echo(f"Metrics: {json.dumps(result['metrics'], indent=2)}")
+    click.echo(_format_feedback_results(results))
 
 
 @cli.command("feedback-status")
 @click.argument("task_id", required=False)
 def feedback_status(task_id):
     """Check status of feedback loops"""
+    from src.core.feedback_orchestrator import FeedbackOrchestrator
+
     orchestrator = FeedbackOrchestrator()
 
     if task_id:
@@ -1193,21 +1380,8 @@ def feedback_status(task_id):
             for entry in status["history"]:
                 click.echo(f"  Iteration {entry['iteration']}: {entry['result']}")
     else:
-        # List all validated tasks
-        import sqlite3
-
-        conn = sqlite3.connect("tasks.db")
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT task_id, description, status, iteration_count, max_iterations
-            FROM validated_tasks
-            ORDER BY created_at DESC
-            LIMIT 10
-        """)
-
-        rows = cursor.fetchall()
-        conn.close()
+        # List recent validated tasks
+        rows = orchestrator.list_validated_tasks(10)
 
         if not rows:
             click.echo("No validated tasks found")
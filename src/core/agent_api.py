@@ -6,12 +6,51 @@ Uses Claude API for actual agent work instead of CLI processes
 import os
 import json
 import time
-from typing import Dict, Optional, Any
+import atexit
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
-import anthropic
 from pathlib import Path
 
+from . import json_utils
+from .database import DatabaseManager
+from .exceptions import TaskError
+
+logger = logging.getLogger(__name__)
+
+# The SDK is imported when a client is first created; it takes longer to load
+# than the rest of the CLI, and demo mode never needs it
+if TYPE_CHECKING:
+    import anthropic
+
+
+# Request parameters shared by the sync and async Claude code paths
+CLAUDE_MESSAGE_PARAMS = {
+    "model": "claude-3-sonnet-20241022",
+    "max_tokens": 4000,
+    "temperature": 0.7,
+}
+
+# Default cap on concurrent API requests in execute_tasks_async()
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Tasks packed into one request by execute_batch(), and the output token
+# ceiling for such a request
+DEFAULT_BATCH_SIZE = 8
+BATCH_MAX_TOKENS = 16000
+
+# How long Claude responses are reused for an identical prompt (0 disables)
+DEFAULT_CACHE_TTL_SECONDS = 24 * 3600
+
+# Append-only log of task results under base_dir, one JSON object per line.
+# Shared by every AgentAPI (and process) using the same base_dir.
+RESULTS_LOG_NAME = "results.jsonl"
+
 
 class AgentType(Enum):
     CLAUDE = "claude"
@@ -27,99 +66,24 @@ class AgentType(Enum):
     GENERIC = "generic"
 
 
-@dataclass
-class AgentTask:
-    """Represents a task for an agent"""
-
-    task_id: str
-    description: str
-    agent_type: AgentType
-    context: Dict[str, Any] = None
-    status: str = "pending"
-    result: str = None
-    error: str = None
-    started_at: float = 0
-    completed_at: float = 0
-
+# Agent types whose short, structured output is served by a faster model with
+# a smaller token budget: agent type -> (model, max_tokens)
+CLAUDE_MODEL_OVERRIDES = {
+    AgentType.SPECS: ("claude-3-5-haiku-20241022", 1500),
+    AgentType.PROJECT_MANAGER: ("claude-3-5-haiku-20241022", 1500),
+}
 
-class AgentAPI:
-    """Manages API-based agent execution"""
+# Request parameters per agent type, built once from the defaults above
+CLAUDE_PARAMS_BY_TYPE = {
+    agent_type: dict(CLAUDE_MESSAGE_PARAMS) for agent_type in AgentType
+}
+for _agent_type, (_model, _max_tokens) in CLAUDE_MODEL_OVERRIDES.items():
+    CLAUDE_PARAMS_BY_TYPE[_agent_type].update(model=_model, max_tokens=_max_tokens)
 
-    def __init__(self, api_key: str = None, base_dir: str = "/tmp/agent_orchestrator"):
-        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize Claude client if API key available
-        self.client = None
-        if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
-
-        self.tasks: Dict[str, AgentTask] = {}
-
-    def execute_task(self, task: AgentTask) -> str:
-        """Execute a task using the appropriate agent"""
-        task.started_at = time.time()
-        task.status = "in_progress"
-
-        try:
-            # Route to appropriate execution method
-            if task.agent_type == AgentType.CODEX:
-                result = self._execute_codex_task(task)
-            elif self.client:
-                result = self._execute_claude_task(task)
-            else:
-                result = self._execute_mock_task(task)
-
-            task.result = result
-            task.status = "completed"
-            task.completed_at = time.time()
-
-            # Save result to file
-            self._save_result(task)
-
-            return result
-
-        except Exception as e:
-            task.error = str(e)
-            task.status = "failed"
-            task.completed_at = time.time()
-            raise
-
-    def _execute_claude_task(self, task: AgentTask) -> str:
-        """Execute task using Claude API"""
-        # Build the prompt based on agent type
-        prompt = self._build_agent_prompt(task)
-
-        try:
-            # Call Claude API
-            message = self.client.messages.create(
-                model="claude-3-sonnet-20241022",
-                max_tokens=4000,
-                temperature=0.7,
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            # Extract text response
-            result = message.content[0].text if message.content else "No response"
-            return result
-
-        except Exception as e:
-            print(f"Claude API error: {e}")
-            # Fallback to mock execution
-            return self._execute_mock_task(task)
-
-    def _build_agent_prompt(self, task: AgentTask) -> str:
-        """Build specialized prompt based on agent type"""
-        base_prompt = f"Task: {task.description}"
-
-        # Add context if available
-        if task.context:
-            base_prompt += f"\n\nContext:\n{json.dumps(task.context, indent=2)}"
-
-        # Add agent-specific instructions
-        agent_prompts = {
-            AgentType.BACKEND: """
+# Role instructions placed before the task for each Claude agent type
+AGENT_INSTRUCTIONS = {
+    AgentType.BACKEND: """
 You are a backend systems engineer. Focus on:
 - API design and implementation
 - Database schema and queries
@@ -128,7 +92,7 @@ You are a backend systems engineer. Focus on:
 - Error handling and logging
 
 Please provide a detailed implementation plan or solution.""",
-            AgentType.FRONTEND: """
+    AgentType.FRONTEND: """
 You are a frontend UI engineer. Focus on:
 - Component architecture
 - User experience and accessibility
@@ -137,7 +101,7 @@ You are a frontend UI engineer. Focus on:
 - Performance optimization
 
 Please provide a detailed implementation plan or solution.""",
-            AgentType.DATA_PIPELINE: """
+    AgentType.DATA_PIPELINE: """
 You are a data pipeline engineer. Focus on:
 - ETL/ELT design
 - Data quality and validation
@@ -146,7 +110,7 @@ You are a data pipeline engineer. Focus on:
 - Monitoring and alerting
 
 Please provide a detailed implementation plan or solution.""",
-            AgentType.SPECS: """
+    AgentType.SPECS: """
 You are a specifications engineer. Focus on:
 - Clear requirements definition
 - Acceptance criteria
@@ -155,7 +119,7 @@ You are a specifications engineer. Focus on:
 - Testing requirements
 
 Please provide detailed specifications.""",
-            AgentType.PROJECT_MANAGER: """
+    AgentType.PROJECT_MANAGER: """
 You are a project delivery manager. Focus on:
 - Task breakdown and dependencies
 - Timeline and milestones
@@ -164,26 +128,18 @@ You are a project delivery manager. Focus on:
 - Success metrics
 
 Please provide a project plan.""",
-        }
+}
 
-        agent_instruction = agent_prompts.get(
-            task.agent_type,
-            "You are an AI assistant. Please complete the task to the best of your ability.",
-        )
+DEFAULT_AGENT_INSTRUCTION = (
+    "You are an AI assistant. Please complete the task to the best of your ability."
+)
 
-        return f"{agent_instruction}\n\n{base_prompt}"
 
-    def _execute_codex_task(self, task: AgentTask) -> str:
-        """Execute task using Codex/OpenAI API (placeholder)"""
-        # This would integrate with OpenAI API if available
-        # For now, return mock response
-        return self._execute_mock_task(task)
-
-    def _execute_mock_task(self, task: AgentTask) -> str:
-        """Execute task in mock/demo mode"""
-        responses = {
-            AgentType.BACKEND: f"""
-DEMO MODE - Backend Implementation Plan for: {task.description}
+# Demo-mode responses used when no API client is available, formatted with
+# the task description
+MOCK_RESPONSES = {
+    AgentType.BACKEND: """
+DEMO MODE - Backend Implementation Plan for: {description}
 
 1. API Design:
    - RESTful endpoints following best practices
@@ -208,8 +164,8 @@ DEMO MODE - Backend Implementation Plan for: {task.description}
    - Integration tests for API endpoints
    - Performance testing for critical paths
 """,
-            AgentType.FRONTEND: f"""
-DEMO MODE - Frontend Implementation Plan for: {task.description}
+    AgentType.FRONTEND: """
+DEMO MODE - Frontend Implementation Plan for: {description}
 
 1. Component Architecture:
    - Modular, reusable components
@@ -236,8 +192,8 @@ DEMO MODE - Frontend Implementation Plan for: {task.description}
    - Integration tests for user flows
    - Visual regression testing
 """,
-            AgentType.DATA_PIPELINE: f"""
-DEMO MODE - Data Pipeline Design for: {task.description}
+    AgentType.DATA_PIPELINE: """
+DEMO MODE - Data Pipeline Design for: {description}
 
 1. Data Ingestion:
    - Batch and streaming ingestion support
@@ -264,8 +220,8 @@ DEMO MODE - Data Pipeline Design for: {task.description}
    - Pipeline performance metrics
    - Cost optimization tracking
 """,
-            AgentType.SPECS: f"""
-DEMO MODE - Specifications for: {task.description}
+    AgentType.SPECS: """
+DEMO MODE - Specifications for: {description}
 
 ## Functional Requirements
 1. The system SHALL provide the requested functionality
@@ -289,48 +245,563 @@ DEMO MODE - Specifications for: {task.description}
 3. Performance under load
 4. Security vulnerability testing
 """,
-        }
+}
+
+DEFAULT_MOCK_RESPONSE = (
+    "DEMO MODE - Generic response for: {description}\n\n"
+    "Task would be processed by {agent} agent."
+)
+
+
+@dataclass
+class AgentTask:
+    """Represents a task for an agent"""
 
-        return responses.get(
-            task.agent_type,
-            f"DEMO MODE - Generic response for: {task.description}\n\nTask would be processed by {task.agent_type.value} agent.",
+    task_id: str
+    description: str
+    agent_type: AgentType
+    context: Dict[str, Any] = None
+    status: str = "pending"
+    result: str = None
+    error: str = None
+    started_at: float = 0
+    completed_at: float = 0
+    # Monotonic clock readings used for durations; wall-clock times above are
+    # only kept for reporting
+    started_ns: int = 0
+    completed_ns: int = 0
+
+    def mark_started(self):
+        self.started_at = time.time()
+        self.started_ns = time.monotonic_ns()
+        self.status = "in_progress"
+
+    def mark_finished(self, status: str):
+        self.completed_ns = time.monotonic_ns()
+        self.completed_at = (
+            self.started_at + (self.completed_ns - self.started_ns) / 1e9
+        )
+        self.status = status
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if not self.completed_ns:
+            return None
+        return (self.completed_ns - self.started_ns) // 1_000_000
+
+
+class AgentAPI:
+    """Manages API-based agent execution"""
+
+    def __init__(
+        self,
+        api_key: str = None,
+        base_dir: str = "/tmp/agent_orchestrator",
+        db_path: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+    ):
+        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.base_dir = Path(base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        # Initialize Claude client if API key available
+        self.client = None
+        if self.api_key:
+            import anthropic
+
+            self.client = anthropic.Anthropic(api_key=self.api_key)
+
+        # Async client is created on first use, per event loop, since its
+        # connection pool cannot outlive the loop it was opened on
+        self.aclient = None
+        self._aclient_loop = None
+
+        # Response cache lives in the task database, opened on first use
+        self.db_path = db_path
+        self.cache_ttl = cache_ttl
+        self._cache_db: Optional[DatabaseManager] = None
+        # Set after the first cache error; tasks then run uncached
+        self._cache_failed = False
+
+        # Results log, opened on first use; task_id -> offset of its latest
+        # line, covering the log up to _results_scanned plus our own writes
+        self._results_path = self.base_dir / RESULTS_LOG_NAME
+        self._results_fd: Optional[int] = None
+        self._result_offsets: Dict[str, int] = {}
+        self._results_scanned = 0
+        self._results_lock = threading.Lock()
+        self._closed_at_exit = False
+
+        self.tasks: Dict[str, AgentTask] = {}
+
+    def execute_task(self, task: AgentTask) -> str:
+        """Execute a task using the appropriate agent"""
+        return "".join(self.execute_task_streaming(task))
+
+    def execute_task_streaming(self, task: AgentTask) -> Iterator[str]:
+        """Execute a task, yielding the response text as it is generated.
+
+        Claude responses are streamed chunk by chunk so callers can inspect
+        the start of the output early; other agents yield their result whole.
+        The task is updated and saved once the stream is exhausted.
+        """
+        task.mark_started()
+
+        try:
+            # Route to appropriate execution method
+            if task.agent_type == AgentType.CODEX:
+                chunks = [self._execute_codex_task(task)]
+            elif self.client:
+                chunks = self._stream_claude_task(task)
+            else:
+                chunks = [self._execute_mock_task(task)]
+
+            parts = []
+            for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+            result = "".join(parts)
+
+            task.result = result
+            task.mark_finished("completed")
+
+            # Save result to file
+            self._save_result(task)
+
+        except Exception as e:
+            task.error = str(e)
+            task.mark_finished("failed")
+            raise
+
+    async def execute_task_async(self, task: AgentTask) -> str:
+        """Execute a task without blocking the event loop on the API call"""
+        task.mark_started()
+
+        try:
+            # Route to appropriate execution method
+            if task.agent_type == AgentType.CODEX:
+                result = self._execute_codex_task(task)
+            elif self.api_key:
+                result = await self._execute_claude_task_async(task)
+            else:
+                result = self._execute_mock_task(task)
+
+            task.result = result
+            task.mark_finished("completed")
+
+            # Save result to file
+            self._save_result(task)
+
+            return result
+
+        except Exception as e:
+            task.error = str(e)
+            task.mark_finished("failed")
+            raise
+
+    async def execute_tasks_async(
+        self, tasks: List[AgentTask], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Any]:
+        """Execute tasks concurrently, at most `max_concurrency` at a time.
+
+        Returns results in task order; a task that failed is represented by
+        its exception (its status and error are also set on the task).
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(task: AgentTask) -> str:
+            async with semaphore:
+                return await self.execute_task_async(task)
+
+        return await asyncio.gather(
+            *(run(task) for task in tasks), return_exceptions=True
+        )
+
+    def execute_tasks(
+        self, tasks: List[AgentTask], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Any]:
+        """Synchronous entry point for execute_tasks_async()"""
+        return asyncio.run(self.execute_tasks_async(tasks, max_concurrency))
+
+    def _get_async_client(self) -> "anthropic.AsyncAnthropic":
+        """Return the async client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self.aclient is None or self._aclient_loop is not loop:
+            import anthropic
+
+            self.aclient = anthropic.AsyncAnthropic(api_key=self.api_key)
+            self._aclient_loop = loop
+        return self.aclient
+
+    async def _execute_claude_task_async(self, task: AgentTask) -> str:
+        """Execute task using the async Claude API client"""
+        prompt = self._build_agent_prompt(task)
+        params = CLAUDE_PARAMS_BY_TYPE[task.agent_type]
+        cache_key = self._cache_key(prompt, params)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            message = await self._get_async_client().messages.create(
+                messages=[{"role": "user", "content": prompt}],
+                **params,
+            )
+
+            # Extract text response
+            result = message.content[0].text if message.content else "No response"
+            self._store_response(cache_key, result)
+            return result
+
+        except Exception as e:
+            print(f"Claude API error: {e}")
+            # Fallback to mock execution
+            return self._execute_mock_task(task)
+
+    def _execute_claude_task(self, task: AgentTask) -> str:
+        """Execute task using Claude API"""
+        return "".join(self._stream_claude_task(task))
+
+    def _stream_claude_task(self, task: AgentTask) -> Iterator[str]:
+        """Stream a task's response text from the Claude API"""
+        # Build the prompt based on agent type
+        prompt = self._build_agent_prompt(task)
+        params = CLAUDE_PARAMS_BY_TYPE[task.agent_type]
+
+        # Identical prompts are answered from the response cache
+        cache_key = self._cache_key(prompt, params)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts = []
+        try:
+            # Call Claude API
+            with self.client.messages.stream(
+                messages=[{"role": "user", "content": prompt}],
+                **params,
+            ) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
+
+        except Exception as e:
+            print(f"Claude API error: {e}")
+            if parts:
+                # Part of the response was already handed out; don't mix in
+                # a demo response
+                raise
+            # Fallback to mock execution
+            yield self._execute_mock_task(task)
+            return
+
+        if not parts:
+            yield "No response"
+            return
+        self._store_response(cache_key, "".join(parts))
+
+    def _get_cache_db(self) -> DatabaseManager:
+        """Open the response cache table on first use"""
+        if self._cache_db is None:
+            db = DatabaseManager(self.db_path)
+            db.init_schema(
+                """
+                CREATE TABLE IF NOT EXISTS prompt_cache (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    cache_ttl REAL
+                )
+                """
+            )
+            self._cache_db = db
+        return self._cache_db
+
+    @staticmethod
+    def _cache_key(prompt: str, params: Dict[str, Any]) -> str:
+        """Hash a prompt together with the request parameters it is sent with"""
+        payload = json.dumps([params, prompt], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_enabled(self) -> bool:
+        return bool(self.cache_ttl) and not self._cache_failed
+
+    def _disable_cache(self, error: Exception):
+        """Stop using the response cache after it fails once"""
+        self._cache_failed = True
+        logger.warning("Response cache unavailable, continuing without it: %s", error)
+
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Return an unexpired cached response, if any"""
+        if not self._cache_enabled():
+            return None
+        try:
+            rows = self._get_cache_db().execute_query(
+                """
+                SELECT result FROM prompt_cache
+                WHERE key = ? AND (cache_ttl IS NULL OR created_at + cache_ttl > ?)
+                """,
+                (key, time.time()),
+            )
+        except (TaskError, sqlite3.Error, OSError) as e:
+            self._disable_cache(e)
+            return None
+        return rows[0]["result"] if rows else None
+
+    def _store_response(self, key: str, result: str):
+        """Remember a Claude response for later identical prompts"""
+        if not self._cache_enabled():
+            return
+        try:
+            self._get_cache_db().execute_update(
+                """
+                INSERT OR REPLACE INTO prompt_cache (key, result, created_at, cache_ttl)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, result, time.time(), self.cache_ttl),
+            )
+        except (TaskError, sqlite3.Error, OSError) as e:
+            self._disable_cache(e)
+
+    def execute_batch(
+        self, tasks: List[AgentTask], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[str]:
+        """Execute tasks with one Claude request per group of same-type tasks.
+
+        Tasks are grouped by agent type and sent `batch_size` at a time as a
+        JSON list, with the agent instructions included once per request.
+        Tasks the response does not answer, and every task when no API client
+        is configured, run individually through execute_task().
+        Returns results in task order.
+        """
+        results: Dict[str, str] = {}
+        if self.client:
+            groups: Dict[AgentType, List[AgentTask]] = {}
+            for task in tasks:
+                if task.agent_type != AgentType.CODEX:
+                    groups.setdefault(task.agent_type, []).append(task)
+
+            for group in groups.values():
+                for start in range(0, len(group), batch_size):
+                    chunk = group[start : start + batch_size]
+                    if len(chunk) > 1:
+                        results.update(self._execute_claude_batch(chunk))
+
+        # Anything not answered by a batch request runs on its own
+        for task in tasks:
+            if task.task_id not in results:
+                results[task.task_id] = self.execute_task(task)
+
+        return [results[task.task_id] for task in tasks]
+
+    def _execute_claude_batch(self, tasks: List[AgentTask]) -> Dict[str, str]:
+        """Run same-type tasks in a single Claude request.
+
+        Returns a task_id -> result mapping for the tasks that were answered;
+        those tasks are marked completed and saved like execute_task() does.
+        """
+        for task in tasks:
+            task.mark_started()
+
+        # Tasks in a batch share an agent type, and with it a model
+        params = dict(CLAUDE_PARAMS_BY_TYPE[tasks[0].agent_type])
+        params["max_tokens"] = min(params["max_tokens"] * len(tasks), BATCH_MAX_TOKENS)
+
+        try:
+            message = self.client.messages.create(
+                messages=[{"role": "user", "content": self._build_batch_prompt(tasks)}],
+                **params,
+            )
+        except Exception as e:
+            print(f"Claude API batch error: {e}")
+            return {}
+
+        text = message.content[0].text if message.content else ""
+        answers = self._parse_batch_response(text)
+
+        results = {}
+        for task in tasks:
+            result = answers.get(task.task_id)
+            if not result:
+                continue
+            if not isinstance(result, str):
+                result = json_utils.dumps(result, indent=True)
+
+            task.result = result
+            task.mark_finished("completed")
+            self._save_result(task)
+            results[task.task_id] = result
+
+        return results
+
+    def _build_batch_prompt(self, tasks: List[AgentTask]) -> str:
+        """Build one prompt covering several tasks of the same agent type"""
+        items = []
+        for task in tasks:
+            item = {"id": task.task_id, "description": task.description}
+            if task.context:
+                item["context"] = task.context
+            items.append(item)
+
+        return (
+            f"{self._agent_instruction(tasks[0].agent_type)}\n\n"
+            f"Complete each of the following {len(tasks)} tasks independently.\n\n"
+            f"Tasks:\n{json_utils.dumps(items, indent=True)}\n\n"
+            "Respond with only a JSON object that maps each task id to the "
+            "complete result for that task."
+        )
+
+    @staticmethod
+    def _parse_batch_response(text: str) -> Dict[str, Any]:
+        """Extract the id -> result object from a batch response"""
+        start = text.find("{")
+        end = text.rfind("}")
+        if start == -1 or end < start:
+            return {}
+        try:
+            answers = json_utils.loads(text[start : end + 1])
+        except json.JSONDecodeError:
+            return {}
+        return answers if isinstance(answers, dict) else {}
+
+    def _build_agent_prompt(self, task: AgentTask) -> str:
+        """Build specialized prompt based on agent type"""
+        base_prompt = f"Task: {task.description}"
+
+        # Add context if available
+        if task.context:
+            context = json_utils.dumps(task.context, indent=True)
+            base_prompt += f"\n\nContext:\n{context}"
+
+        return f"{self._agent_instruction(task.agent_type)}\n\n{base_prompt}"
+
+    def _agent_instruction(self, agent_type: AgentType) -> str:
+        """Return the role instructions placed before an agent's tasks"""
+        return AGENT_INSTRUCTIONS.get(agent_type, DEFAULT_AGENT_INSTRUCTION)
+
+    def _execute_codex_task(self, task: AgentTask) -> str:
+        """Execute task using Codex/OpenAI API (placeholder)"""
+        # This would integrate with OpenAI API if available
+        # For now, return mock response
+        return self._execute_mock_task(task)
+
+    def _execute_mock_task(self, task: AgentTask) -> str:
+        """Execute task in mock/demo mode"""
+        template = MOCK_RESPONSES.get(task.agent_type, DEFAULT_MOCK_RESPONSE)
+        return template.format(
+            description=task.description, agent=task.agent_type.value
         )
 
     def _save_result(self, task: AgentTask):
-        """Save task result to file"""
-        task_dir = self.base_dir / f"task_{task.task_id}"
-        task_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save result
-        result_file = task_dir / "result.txt"
-        with open(result_file, "w") as f:
-            f.write(task.result or task.error or "No output")
-
-        # Save metadata
-        metadata_file = task_dir / "metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(
-                {
-                    "task_id": task.task_id,
-                    "description": task.description,
-                    "agent_type": task.agent_type.value,
-                    "status": task.status,
-                    "started_at": task.started_at,
-                    "completed_at": task.completed_at,
-                    "duration": task.completed_at - task.started_at
-                    if task.completed_at
-                    else None,
-                    "context": task.context,
-                },
-                f,
-                indent=2,
+        """Append task result and metadata to the results log"""
+        record = {
+            "task_id": task.task_id,
+            "description": task.description,
+            "agent_type": task.agent_type.value,
+            "status": task.status,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "duration_ms": task.duration_ms,
+            "context": task.context,
+            "result": task.result or task.error or "No output",
+        }
+        line = json_utils.dumps_bytes(record) + b"\n"
+
+        with self._results_lock:
+            fd = self._open_results_log()
+            # One unbuffered write on an O_APPEND fd lands as a whole line even
+            # with other writers; the fd's position afterwards is where it ended
+            written = os.write(fd, line)
+            offset = os.lseek(fd, 0, os.SEEK_CUR) - written
+            while written < len(line):
+                written += os.write(fd, line[written:])
+            self._result_offsets[task.task_id] = offset
+
+    def _open_results_log(self) -> int:
+        """Open the results log for appending, indexing it on first open.
+
+        Must be called with _results_lock held.
+        """
+        if self._results_fd is None:
+            self._scan_results_log()
+            self._results_fd = os.open(
+                self._results_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
             )
+            if not self._closed_at_exit:
+                atexit.register(self.close)
+                self._closed_at_exit = True
+        return self._results_fd
+
+    def _scan_results_log(self, start: int = 0):
+        """Index results log lines from offset start to the last whole line.
+
+        Lines written by other instances or processes are picked up here.
+        Must be called with _results_lock held.
+        """
+        try:
+            f = open(self._results_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Another writer's line still being written
+                try:
+                    task_id = json_utils.loads(line)["task_id"]
+                except (ValueError, KeyError, TypeError):
+                    task_id = None  # Skip a torn or foreign line
+                if task_id is not None:
+                    self._result_offsets[task_id] = offset
+                offset += len(line)
+        self._results_scanned = offset
+
+    def _read_result_at(self, task_id: str, offset: Optional[int]) -> Optional[str]:
+        """Result stored at offset, or None if that line isn't task_id's"""
+        if offset is None:
+            return None
+        try:
+            with open(self._results_path, "rb") as f:
+                f.seek(offset)
+                record = json_utils.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("task_id") != task_id:
+            return None
+        return record.get("result")
+
+    def close(self):
+        """Close the results log"""
+        with self._results_lock:
+            if self._results_fd is not None:
+                os.close(self._results_fd)
+                self._results_fd = None
 
     def get_task_result(self, task_id: str) -> Optional[str]:
         """Get result for a completed task"""
-        task_dir = self.base_dir / f"task_{task_id}"
-        result_file = task_dir / "result.txt"
+        with self._results_lock:
+            self._open_results_log()
+            offset = self._result_offsets.get(task_id)
+            result = self._read_result_at(task_id, offset)
+            if result is None:
+                # Saved by another writer since we last looked, or the index
+                # is stale: pick up the tail, or reindex after a mismatch
+                if offset is None:
+                    self._scan_results_log(self._results_scanned)
+                else:
+                    self._result_offsets.clear()
+                    self._scan_results_log()
+                result = self._read_result_at(
+                    task_id, self._result_offsets.get(task_id)
+                )
+
+        if result is not None:
+            return result
 
+        # Results saved before the results log existed
+        result_file = self.base_dir / f"task_{task_id}" / "result.txt"
         if result_file.exists():
             with open(result_file, "r") as f:
                 return f.read()
@@ -3,23 +3,67 @@ Simple Agent Spawner for CLI processes
 Direct subprocess management for codex and claude CLI tools
 """
 
+import asyncio
+import logging
 import subprocess
 import os
 import time
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Deque, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import threading
-import queue
+import selectors
 import shutil
 import textwrap
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from .input_validator import InputValidator, ValidationError
 from .claude_cli_manager import get_claude_manager
 from .file_operations import FileOperations
 from .config import get_config
 
+logger = logging.getLogger(__name__)
+
+# Characters of agent output included in output_queue records; the full
+# output stays on disk and is read on demand by get_agent_output()
+OUTPUT_HEAD_CHARS = 4096
+
+# Static parts of the prompt built by _prepare_prompt()
+PROMPT_INSTRUCTIONS = (
+    "\n\n"
+    "Instructions:\n"
+    "1. Complete the task described above\n"
+    "2. Write any output or results to output.txt in the current directory\n"
+    "3. If context is provided, it's available in context.json\n"
+    "\n"
+)
+PROMPT_CONTEXT_NOTE = "Context has been provided in context.json. Please review it.\n\n"
+PROMPT_TAIL = "Please complete this task now."
+
+# Run in place of codex when its CLI is not installed
+CODEX_FALLBACK_SCRIPT = textwrap.dedent(
+    """
+    cat <<'SCRIPT' > generated_process_list.sh
+    #!/usr/bin/env bash
+    set -euo pipefail
+    ps aux
+    SCRIPT
+    chmod +x generated_process_list.sh
+    cat <<'EOF' > output.txt
+    Generated bash script saved to ./generated_process_list.sh
+
+    ```bash
+    #!/usr/bin/env bash
+    set -euo pipefail
+    ps aux
+    ```
+    EOF
+    """
+).strip()
+
 
 class AgentType(Enum):
     CLAUDE = "claude"
@@ -49,7 +93,29 @@ class AgentProcess:
     task_id: Optional[str] = None
     status: str = "idle"
     started_at: float = 0
+    # Monotonic clock readings used for durations and age checks; started_at
+    # is wall-clock and only kept for reporting
+    started_ns: int = 0
+    completed_ns: int = 0
     output_file: Optional[str] = None
+    # Set by the monitor thread once the process has exited and `status`
+    # reflects the outcome; None while the agent is still running
+    return_code: Optional[int] = None
+
+
+# Takes the prompt and returns the argv and the stdin payload, if any
+ArgvBuilder = Callable[[str], Tuple[List[str], Optional[str]]]
+
+
+def _fixed_argv(argv: Tuple[str, ...]) -> ArgvBuilder:
+    """Builder for a command that does not take the prompt"""
+    return lambda prompt: (list(argv), None)
+
+
+def _elapsed(agent: AgentProcess, now_ns: Optional[int] = None) -> float:
+    """Seconds an agent has run, up to its exit if it has exited"""
+    end_ns = agent.completed_ns or now_ns or time.monotonic_ns()
+    return (end_ns - agent.started_ns) / 1e9
 
 
 class AgentSpawner:
@@ -64,6 +130,9 @@ class AgentSpawner:
     ):
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Copy-on-write registry: writers build a new dict under _registry_lock
+        # and rebind it, so readers can iterate whatever dict they picked up
+        # without locking
         self.agents: Dict[str, AgentProcess] = {}
         self.max_agents = max_agents
         self.max_output_queue_size = max_output_queue_size
@@ -71,10 +140,47 @@ class AgentSpawner:
         if max_runtime_hours is None:
             max_runtime_hours = config_runtime if config_runtime is not None else 0
         self.max_runtime_hours = max_runtime_hours
-        self.output_queue = queue.Queue(maxsize=max_output_queue_size)
+        # Exit records, oldest first; appending to a full deque drops the
+        # oldest record, so the reaper never blocks on a slow consumer
+        self.output_queue: Deque[Dict] = deque(maxlen=max_output_queue_size)
+        self._new_output = threading.Event()
         self._cleanup_lock = threading.Lock()
+        # Serializes the capacity check and registration when spawning
+        # from several threads at once
+        self._spawn_lock = threading.Lock()
+        # Held only while swapping in a new agents dict; never held while
+        # taking another lock
+        self._registry_lock = threading.Lock()
+        # Per-agent asyncio futures resolved by the monitor thread on exit
+        self._exit_waiters: Dict[str, List] = {}
+        self._exit_waiters_lock = threading.Lock()
         self._cleanup_thread = None
-        self._shutdown = False
+        # Set by cleanup_all(); wakes the cleanup thread out of its wait
+        self._shutdown = threading.Event()
+
+        # One reaper thread watches every agent's pidfd for exit; started on
+        # first spawn. Platforms without pidfd use a monitor thread per agent
+        self._reaper_selector = None
+        self._reaper_wakeup = None
+        self._reaper_thread = None
+        self._reaper_lock = threading.Lock()
+
+        # Agent CLI name -> absolute path (None if not installed). Spawning
+        # by absolute path spares the child a PATH search before exec
+        self._cli_paths: Dict[str, Optional[str]] = {}
+        # Agent type -> command builder specialized for it on first spawn
+        self._argv_builders: Dict[AgentType, ArgvBuilder] = {}
+
+        # Working directories are renamed aside and deleted in the background;
+        # the worker thread only starts on first use
+        self._trash_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="agent-trash"
+        )
+        # Reads output summaries for exit records off the reaper thread; two
+        # workers keep concurrent reads of large outputs bounded
+        self._reader_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="agent-output"
+        )
 
         # Start periodic cleanup
         self._start_cleanup_thread()
@@ -120,21 +226,32 @@ class AgentSpawner:
         prompt = self._prepare_prompt(safe_description, context)
 
         # Build the command based on agent type
-        cmd_args = self._build_command_args(agent_type, prompt, working_dir)
+        cmd_args, stdin_prompt = self._build_command_args(
+            agent_type, prompt, working_dir
+        )
 
         # Create output file for capturing results
         output_file = working_dir / "output.txt"
 
-        # Spawn the process safely without shell=True
-        with open(output_file, "w") as out_f:
+        # The child writes straight to the output file through a raw fd; no
+        # Python file object or buffer sits between it and the kernel, and
+        # the parent's copy is closed once the child has inherited it
+        out_fd = os.open(str(output_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Spawn the process safely without shell=True
             process = subprocess.Popen(
                 cmd_args,
                 cwd=str(working_dir),
-                stdout=out_f,
+                stdin=subprocess.PIPE if stdin_prompt is not None else None,
+                stdout=out_fd,
                 stderr=subprocess.STDOUT,
-                text=True,
                 shell=False,  # CRITICAL: Never use shell=True
             )
+        finally:
+            os.close(out_fd)
+
+        if stdin_prompt is not None:
+            self._write_prompt_to_stdin(process, stdin_prompt)
 
         # Create agent process record
         agent = AgentProcess(
@@ -145,28 +262,30 @@ class AgentSpawner:
             task_id=task_id,
             status="running",
             started_at=time.time(),
+            started_ns=time.monotonic_ns(),
             output_file=str(output_file),
         )
 
-        # Check if we've hit max agents limit
-        if len(self.agents) >= self.max_agents:
-            # Clean up completed agents first
-            self._cleanup_completed_agents()
-
-            # If still at limit, fail
+        with self._spawn_lock:
+            # Check if we've hit max agents limit
             if len(self.agents) >= self.max_agents:
-                process.terminate()
-                raise ValueError(
-                    f"Maximum number of agents ({self.max_agents}) reached"
-                )
+                # Clean up completed agents first
+                self._cleanup_completed_agents()
+
+                # If still at limit, fail
+                if len(self.agents) >= self.max_agents:
+                    process.terminate()
+                    raise ValueError(
+                        f"Maximum number of agents ({self.max_agents}) reached"
+                    )
 
-        self.agents[agent_id] = agent
+            with self._registry_lock:
+                agents = dict(self.agents)
+                agents[agent_id] = agent
+                self.agents = agents
 
-        # Start monitoring thread
-        monitor_thread = threading.Thread(
-            target=self._monitor_agent, args=(agent_id,), daemon=True
-        )
-        monitor_thread.start()
+        # Start monitoring the process for exit
+        self._watch_agent(agent)
 
         return agent_id
 
@@ -181,200 +300,310 @@ class AgentSpawner:
 
     def _prepare_prompt(self, task_description: str, context: Dict = None) -> str:
         """Prepare the prompt for the agent"""
-        prompt_parts = [
-            f"Task: {task_description}",
-            "",
-            "Instructions:",
-            "1. Complete the task described above",
-            "2. Write any output or results to output.txt in the current directory",
-            "3. If context is provided, it's available in context.json",
-            "",
-        ]
-
-        if context:
-            prompt_parts.append(
-                "Context has been provided in context.json. Please review it."
-            )
-            prompt_parts.append("")
+        context_note = PROMPT_CONTEXT_NOTE if context else ""
+        return (
+            f"Task: {task_description}{PROMPT_INSTRUCTIONS}{context_note}{PROMPT_TAIL}"
+        )
 
-        prompt_parts.append("Please complete this task now.")
+    @staticmethod
+    def _write_prompt_to_stdin(process: subprocess.Popen, prompt: str):
+        """Send the prompt to an agent that reads it from stdin.
 
-        return "\n".join(prompt_parts)
+        The prompt is encoded once and written straight to the pipe, advancing
+        a memoryview over the buffer on short writes instead of copying it.
+        """
+        data = memoryview(prompt.encode("utf-8"))
+        fd = process.stdin.fileno()
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        except OSError:
+            # Agent exited before reading its prompt; the monitor thread
+            # records the failure from its exit status
+            pass
+        finally:
+            # Nothing sits in the pipe's Python buffer, so closing cannot fail
+            process.stdin.close()
+
+    def _find_cli(self, name: str) -> Optional[str]:
+        """Absolute path of an agent CLI, looked up once per spawner"""
+        if name not in self._cli_paths:
+            self._cli_paths[name] = shutil.which(name)
+        return self._cli_paths[name]
 
     def _build_command_args(
         self, agent_type: AgentType, prompt: str, working_dir: Path
-    ) -> List[str]:
-        """Build the command arguments list (no shell injection possible)"""
-        # Save prompt to file securely
-        prompt_file = working_dir / "prompt.txt"
-        if not FileOperations.safe_write_text(prompt_file, prompt):
-            raise ValueError("Cannot write prompt file")
+    ) -> Tuple[List[str], Optional[str]]:
+        """Build the command arguments list (no shell injection possible).
+
+        Returns the argv and, for CLIs that read their prompt from stdin, the
+        text to pipe in (None when the prompt is not sent on stdin).
+        """
+        builder = self._argv_builders.get(agent_type)
+        if builder is None:
+            builder = self._make_argv_builder(agent_type)
+            self._argv_builders[agent_type] = builder
+        return builder(prompt)
+
+    def _make_argv_builder(self, agent_type: AgentType) -> ArgvBuilder:
+        """Specialize command construction for one agent type.
 
+        The CLI lookup and every branch on the agent type are settled here,
+        once per spawner, leaving a builder that only fills in the prompt.
+        """
         if agent_type == AgentType.CODEX:
             # Check if codex CLI exists
-            if not shutil.which("codex"):
+            codex_path = self._find_cli("codex")
+            if not codex_path:
                 # Fallback: synthesize a simple script artifact for regression testing
-                fallback_script = textwrap.dedent(
-                    """
-                    cat <<'SCRIPT' > generated_process_list.sh
-                    #!/usr/bin/env bash
-                    set -euo pipefail
-                    ps aux
-                    SCRIPT
-                    chmod +x generated_process_list.sh
-                    cat <<'EOF' > output.txt
-                    Generated bash script saved to ./generated_process_list.sh
-
-                    ```bash
-                    #!/usr/bin/env bash
-                    set -euo pipefail
-                    ps aux
-                    ```
-                    EOF
-                    """
-                ).strip()
-
-                return ["sh", "-c", fallback_script]
-            # Codex CLI with full access - safe command args
-            return [
-                "codex",
+                return _fixed_argv(("sh", "-c", CODEX_FALLBACK_SCRIPT))
+            # Codex CLI with full access - safe command args; "-" reads the
+            # prompt from stdin
+            argv = (
+                codex_path,
                 "--ask-for-approval",
                 "never",
                 "--sandbox",
                 "danger-full-access",
                 "exec",
                 "--skip-git-repo-check",
-                f"@{prompt_file}",  # Read from file instead of command substitution
-            ]
+                "-",
+            )
+            return lambda prompt: (list(argv), prompt)
         elif agent_type == AgentType.GEMINI:
             # Check if gemini CLI exists
-            if not shutil.which("gemini"):
-                return [
-                    "sh",
-                    "-c",
-                    'echo "DEMO MODE: Gemini would process task" > output.txt',
-                ]
+            gemini_path = self._find_cli("gemini")
+            if not gemini_path:
+                return _fixed_argv(
+                    (
+                        "sh",
+                        "-c",
+                        'echo "DEMO MODE: Gemini would process task" > output.txt',
+                    )
+                )
 
             # Gemini CLI non-interactive mode uses -p "<prompt>"
-            return [
-                "gemini",
-                "-p",
-                prompt,
-            ]
+            return lambda prompt: ([gemini_path, "-p", prompt], None)
         else:
             # All agent types (including specialized) use Claude CLI
-            if not shutil.which("claude"):
-                return [
-                    "sh",
-                    "-c",
-                    f'echo "DEMO MODE: Claude {agent_type.value} would process task" > output.txt',
-                ]
+            claude_path = self._find_cli("claude")
+            if not claude_path:
+                return _fixed_argv(
+                    (
+                        "sh",
+                        "-c",
+                        f'echo "DEMO MODE: Claude {agent_type.value} would process task" > output.txt',
+                    )
+                )
+
+            # In print mode Claude reads the prompt from stdin when none is given
+            argv = (claude_path, "--dangerously-skip-permissions", "-p")
+            if agent_type == AgentType.CLAUDE:
+                return lambda prompt: (list(argv), prompt)
 
             # For specialized agents, build a prompt that instructs Claude to use its Task tool
-            if agent_type != AgentType.CLAUDE:
-                specialized_prompt = self._build_specialized_prompt(agent_type, prompt)
-                specialized_file = working_dir / "specialized_prompt.txt"
-                if not FileOperations.safe_write_text(
-                    specialized_file, specialized_prompt
-                ):
-                    raise ValueError("Cannot write specialized prompt file")
-
-                return [
-                    "claude",
-                    "--dangerously-skip-permissions",
-                    "-p",
-                    specialized_prompt,  # Pass prompt directly, not via file
-                ]
-            else:
-                # Regular Claude without specialization
-                return [
-                    "claude",
-                    "--dangerously-skip-permissions",
-                    "-p",
-                    prompt,  # Pass prompt directly, not via file
-                ]
+            return lambda prompt: (
+                list(argv),
+                self._build_specialized_prompt(agent_type, prompt),
+            )
 
     def _monitor_agent(self, agent_id: str):
         """Monitor an agent process (thread-safe)"""
-        # Handle backward compatibility for existing instances without locks
-        if hasattr(self, "_agents_lock"):
-            with self._agents_lock:
-                agent = self.agents.get(agent_id)
-                if not agent:
-                    return
-        else:
-            agent = self.agents.get(agent_id)
-            if not agent:
-                return
+        agent = self.agents.get(agent_id)
+        if not agent:
+            return
 
         # Wait for process to complete
         return_code = agent.process.wait()
+        self._handle_agent_exit(agent, return_code)
 
-        # Update agent status thread-safely
-        if hasattr(self, "_agents_lock"):
-            with self._agents_lock:
-                if agent_id in self.agents:
-                    self.agents[agent_id].status = (
-                        "completed" if return_code == 0 else "failed"
-                    )
-        else:
-            agent.status = "completed" if return_code == 0 else "failed"
-
-        # Read output
-        output = ""
-        if agent.output_file and os.path.exists(agent.output_file):
-            output = FileOperations.safe_read_text(agent.output_file) or ""
-
-        # Add to output queue with size check (thread-safe)
-        if hasattr(self, "_agents_lock"):
-            with self._agents_lock:
-                current_agent = self.agents.get(agent_id)
-                if current_agent:
-                    result_data = {
-                        "agent_id": agent_id,
-                        "task_id": current_agent.task_id,
-                        "status": current_agent.status,
-                        "output": output,
-                        "return_code": return_code,
-                        "duration": time.time() - current_agent.started_at,
-                    }
-                else:
-                    return  # Agent was cleaned up while we were processing
-        else:
-            result_data = {
-                "agent_id": agent_id,
-                "task_id": agent.task_id,
-                "status": agent.status,
-                "output": output,
-                "return_code": return_code,
-                "duration": time.time() - agent.started_at,
-            }
-
-        if hasattr(self, "_output_lock"):
-            with self._output_lock:
-                try:
-                    # Try to put with timeout to prevent blocking
-                    self.output_queue.put(result_data, timeout=1.0)
-                except queue.Full:
-                    # Queue is full, remove old items and try again
+    def _watch_agent(self, agent: AgentProcess):
+        """Arrange for _handle_agent_exit() to run when the agent exits"""
+        pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(agent.process.pid)
+            except OSError:
+                pidfd = None  # Kernel without pidfd support
+
+        if pidfd is None:
+            # Fall back to a dedicated monitoring thread
+            monitor_thread = threading.Thread(
+                target=self._monitor_agent, args=(agent.agent_id,), daemon=True
+            )
+            monitor_thread.start()
+            return
+
+        with self._reaper_lock:
+            if self._reaper_thread is None:
+                self._start_reaper_thread()
+            self._reaper_selector.register(pidfd, selectors.EVENT_READ, agent)
+
+    def _start_reaper_thread(self):
+        """Start the thread that reaps every pidfd-watched agent.
+
+        Must be called with _reaper_lock held.
+        """
+        selector = selectors.DefaultSelector()
+        wakeup_read, wakeup_write = os.pipe()
+        selector.register(wakeup_read, selectors.EVENT_READ, None)
+
+        def reaper():
+            stopping = False
+            while not stopping:
+                # Exits that are ready alongside the stop request are still
+                # handled, so agents killed before _stop_reaper() are reaped
+                for key, _ in selector.select():
+                    agent = key.data
+                    if agent is None:
+                        os.read(key.fd, 1024)  # Woken up to stop
+                        stopping = True
+                        continue
+
+                    with self._reaper_lock:
+                        selector.unregister(key.fd)
+                    os.close(key.fd)
+
+                    # The pidfd is readable once the process has exited, so
+                    # this only collects the exit status
                     try:
-                        self.output_queue.get_nowait()  # Remove oldest item
-                        self.output_queue.put(result_data, timeout=1.0)
-                    except (queue.Empty, queue.Full):
-                        # If we still can't add, log the issue but don't block
-                        pass
-        else:
+                        self._handle_agent_exit(agent, agent.process.wait())
+                    except Exception:
+                        # Don't let one agent stop the reaper
+                        logger.exception("Failed to handle exit of %s", agent.agent_id)
+
+            # Release the pidfds and the wakeup pipe, and let the next
+            # _watch_agent() start a new reaper. Agents still running (or
+            # registered while stopping) get a monitor thread instead.
+            with self._reaper_lock:
+                for key in list(selector.get_map().values()):
+                    os.close(key.fd)
+                    agent = key.data
+                    if agent is not None:
+                        threading.Thread(
+                            target=lambda a=agent: self._handle_agent_exit(
+                                a, a.process.wait()
+                            ),
+                            daemon=True,
+                        ).start()
+                selector.close()
+                os.close(wakeup_write)
+                self._reaper_selector = None
+                self._reaper_wakeup = None
+                self._reaper_thread = None
+
+        self._reaper_selector = selector
+        self._reaper_wakeup = wakeup_write
+        self._reaper_thread = threading.Thread(target=reaper, daemon=True)
+        self._reaper_thread.start()
+
+    def _stop_reaper(self, timeout: float = 5):
+        """Stop the reaper thread once it has handled exits already pending"""
+        with self._reaper_lock:
+            thread = self._reaper_thread
+            if thread is None:
+                return
+            os.write(self._reaper_wakeup, b"\0")
+        thread.join(timeout=timeout)
+
+    def _handle_agent_exit(self, agent: AgentProcess, return_code: int):
+        """Record an exited agent's status and queue its output"""
+        agent_id = agent.agent_id
+
+        agent.status = "completed" if return_code == 0 else "failed"
+        agent.completed_ns = time.monotonic_ns()
+        agent.return_code = return_code
+
+        # Wake anyone awaiting wait_for_exit()
+        self._notify_exit_waiters(agent_id)
+
+        record = {
+            "agent_id": agent_id,
+            "task_id": agent.task_id,
+            "status": agent.status,
+            "output_size": 0,
+            "output_head": "",
+            "return_code": return_code,
+            "duration": _elapsed(agent),
+        }
+        # The output summary is read on a worker so the reaper never waits on
+        # disk before handling the next exit
+        try:
+            self._reader_pool.submit(self._queue_exit_record, agent.output_file, record)
+        except RuntimeError:
+            # Interpreter shutdown: no new worker threads can be started
+            self._queue_exit_record(agent.output_file, record)
+
+    def _queue_exit_record(self, output_file: Optional[str], record: Dict):
+        """Add an output summary to an exit record and queue it"""
+        # Summarize output without loading all of it into memory
+        if output_file:
             try:
-                # Try to put with timeout to prevent blocking (without lock for backward compatibility)
-                self.output_queue.put(result_data, timeout=1.0)
-            except queue.Full:
-                # Queue is full, remove old items and try again
-                try:
-                    self.output_queue.get_nowait()  # Remove oldest item
-                    self.output_queue.put(result_data, timeout=1.0)
-                except (queue.Empty, queue.Full):
-                    # If we still can't add, log the issue but don't block
-                    pass
+                record["output_size"] = os.path.getsize(output_file)
+                with open(output_file, "r", encoding="utf-8", errors="replace") as f:
+                    record["output_head"] = f.read(OUTPUT_HEAD_CHARS)
+            except OSError:
+                pass
+
+        self.output_queue.append(record)
+        self._new_output.set()
+
+    def get_output(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Pop the oldest agent exit record, waiting up to `timeout` for one.
+
+        Returns None if no record arrives in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.output_queue.popleft()
+            except IndexError:
+                pass
+            # Clear before re-checking so an append racing with us still
+            # leaves the event set for the wait below
+            self._new_output.clear()
+            if self.output_queue:
+                continue
+            if deadline is None:
+                self._new_output.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._new_output.wait(remaining):
+                return None
+
+    def wait_for_exit(self, agent_id: str) -> "asyncio.Future":
+        """Return a future on the running event loop that resolves to agent_id
+        once the agent's process has exited and its status has been recorded.
+
+        Must be called from within a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self._exit_waiters_lock:
+            agent = self.agents.get(agent_id)
+            if agent is None or agent.return_code is not None:
+                future.set_result(agent_id)
+            else:
+                self._exit_waiters.setdefault(agent_id, []).append((loop, future))
+
+        return future
+
+    def _notify_exit_waiters(self, agent_id: str):
+        """Resolve any wait_for_exit() futures registered for an agent"""
+        with self._exit_waiters_lock:
+            waiters = self._exit_waiters.pop(agent_id, [])
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self._resolve_exit_future, future, agent_id)
+            except RuntimeError:
+                pass  # Event loop already closed; nobody is waiting any more
+
+    @staticmethod
+    def _resolve_exit_future(future: "asyncio.Future", agent_id: str):
+        if not future.done():
+            future.set_result(agent_id)
 
     def get_agent_status(self, agent_id: str) -> Optional[Dict]:
         """Get status of a specific agent"""
@@ -382,51 +611,80 @@ class AgentSpawner:
         if not agent:
             return None
 
+        return self._status_record(agent, time.monotonic_ns())
+
+    def get_all_agents(self) -> List[Dict]:
+        """Get status of all agents"""
+        # One clock read for the whole listing; the registry is never
+        # mutated in place, so iterating it needs no copy
+        now = time.monotonic_ns()
+        return [self._status_record(agent, now) for agent in self.agents.values()]
+
+    @staticmethod
+    def _status_record(agent: AgentProcess, now_ns: int) -> Dict:
+        """Build the status dict reported for an agent"""
         return {
-            "agent_id": agent_id,
+            "agent_id": agent.agent_id,
             "agent_type": agent.agent_type.value,
             "task_id": agent.task_id,
             "status": agent.status,
             "working_dir": agent.working_dir,
-            "running": agent.process.poll() is None,
-            "duration": time.time() - agent.started_at if agent.started_at else 0,
+            # Served from the monitor thread's exit record rather than polling
+            # the process, so "running" flips together with "status"
+            "running": agent.return_code is None,
+            "duration": _elapsed(agent, now_ns) if agent.started_ns else 0,
         }
 
-    def get_all_agents(self) -> List[Dict]:
-        """Get status of all agents"""
-        return [self.get_agent_status(aid) for aid in self.agents.keys()]
-
     def kill_agent(self, agent_id: str) -> bool:
         """Kill a running agent process safely"""
         agent = self.agents.get(agent_id)
         if not agent:
             return False
 
-        if agent.process.poll() is None:
+        return bool(self._terminate_agents([agent]))
+
+    def _terminate_agents(self, agents: List[AgentProcess]) -> List[AgentProcess]:
+        """Stop running agents, all against one shared deadline.
+
+        Every process is sent SIGTERM before any is waited on, and processes
+        still alive after 5 seconds are sent SIGKILL together and given 2 more,
+        so stopping N agents takes as long as the slowest rather than the sum.
+        Returns the agents that were running.
+        """
+        running = [agent for agent in agents if agent.process.poll() is None]
+        for agent in running:
             try:
                 # Try graceful termination first
                 agent.process.terminate()
+            except OSError:
+                pass  # Process might already be dead
 
-                # Wait up to 5 seconds for graceful shutdown
-                try:
-                    agent.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    # Force kill if graceful termination failed
-                    agent.process.kill()
-                    # Wait for the process to actually die
-                    try:
-                        agent.process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        pass  # Process is really stuck, but we tried
-
-                agent.status = "killed"
-                return True
-            except (OSError, ProcessLookupError):
-                # Process might already be dead
-                agent.status = "killed"
-                return True
-
-        return False
+        survivors = self._wait_for_exits(running, timeout=5)
+        for agent in survivors:
+            try:
+                # Force kill if graceful termination failed
+                agent.process.kill()
+            except OSError:
+                pass
+        # Anything still alive now is really stuck, but we tried
+        self._wait_for_exits(survivors, timeout=2)
+
+        for agent in running:
+            agent.status = "killed"
+        return running
+
+    @staticmethod
+    def _wait_for_exits(
+        agents: List[AgentProcess], timeout: float
+    ) -> List[AgentProcess]:
+        """Wait until the agents exit or the timeout elapses; return survivors"""
+        deadline = time.monotonic() + timeout
+        for agent in agents:
+            try:
+                agent.process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                pass
+        return [agent for agent in agents if agent.process.poll() is None]
 
     def get_agent_output(self, agent_id: str) -> Optional[str]:
         """Get the output from an agent"""
@@ -434,10 +692,8 @@ class AgentSpawner:
         if not agent or not agent.output_file:
             return None
 
-        if os.path.exists(agent.output_file):
-            return FileOperations.safe_read_text(agent.output_file)
-
-        return None
+        # spawn_agent always creates the file; a missing one reads as None
+        return FileOperations.safe_read_text(agent.output_file)
 
     def cleanup_agent(self, agent_id: str):
         """Clean up agent working directory safely"""
@@ -447,46 +703,62 @@ class AgentSpawner:
             self.kill_agent(agent_id)
 
             # Remove working directory safely
-            try:
-                if os.path.exists(agent.working_dir):
-                    shutil.rmtree(agent.working_dir)
-            except (OSError, PermissionError):
-                # Log but don't fail if we can't clean up directory
-                pass
+            self._remove_directory(agent.working_dir)
 
             # Remove from agents dict
-            del self.agents[agent_id]
+            with self._registry_lock:
+                agents = dict(self.agents)
+                agents.pop(agent_id, None)
+                self.agents = agents
+
+    def _remove_directory(self, path: str):
+        """Delete a directory tree without waiting for the walk.
+
+        The directory is first renamed aside, which frees its path at once,
+        and the tree is then removed on a background thread. Falls back to
+        removing in place if the rename fails. A missing directory is not an
+        error, and neither is anything left behind that cannot be removed.
+        """
+        trash_path = f"{path}.trash.{uuid.uuid4().hex}"
+        try:
+            os.rename(path, trash_path)
+        except FileNotFoundError:
+            return
+        except OSError:
+            # rmtree walks the tree with openat()/unlinkat() relative to
+            # each directory's fd where the platform supports it
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        self._trash_executor.submit(shutil.rmtree, trash_path, ignore_errors=True)
 
     def cleanup_all(self):
         """Clean up all agents and working directories"""
-        # Signal shutdown to cleanup thread
-        self._shutdown = True
-
-        # Wait for cleanup thread to finish
+        # Signal shutdown to the cleanup thread and wait for it to finish
+        self._shutdown.set()
         if self._cleanup_thread and self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=5)
 
-        # Clean up all agents
-        for agent_id in list(self.agents.keys()):
+        # Stop every agent at once while the reaper still runs, so their
+        # exits are recorded and exit waiters resolve; then stop the reaper
+        self._terminate_agents(list(self.agents.values()))
+        self._stop_reaper()
+
+        for agent_id in self.agents:
             self.cleanup_agent(agent_id)
 
         # Clear output queue
-        while not self.output_queue.empty():
-            try:
-                self.output_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.output_queue.clear()
 
     def _start_cleanup_thread(self):
         """Start periodic cleanup thread"""
 
         def cleanup_worker():
-            while not self._shutdown:
+            # Clean up every minute until shutdown
+            while not self._shutdown.wait(timeout=60):
                 try:
-                    time.sleep(60)  # Clean up every minute
-                    if not self._shutdown:
-                        self._cleanup_completed_agents()
-                        self._cleanup_stale_agents()
+                    self._cleanup_completed_agents()
+                    self._cleanup_stale_agents()
                 except Exception:
                     pass  # Don't let cleanup thread crash
 
@@ -494,17 +766,21 @@ class AgentSpawner:
         self._cleanup_thread.start()
 
     def _cleanup_completed_agents(self):
-        """Remove completed agents from memory"""
+        """Remove completed agents from memory.
+
+        Exit state comes from the return code recorded by the reaper, so the
+        sweep makes no waitpid() calls.
+        """
         with self._cleanup_lock:
             completed_agents = []
             for agent_id, agent in self.agents.items():
-                if agent.process.poll() is not None and agent.status in [
+                if agent.return_code is not None and agent.status in [
                     "completed",
                     "failed",
                     "killed",
                 ]:
                     # Only clean up if agent finished more than 5 minutes ago
-                    if time.time() - agent.started_at > 300:
+                    if time.monotonic_ns() - agent.started_ns > 300 * 10**9:
                         completed_agents.append(agent_id)
 
             for agent_id in completed_agents:
@@ -525,13 +801,13 @@ class AgentSpawner:
             return
 
         max_runtime_seconds = runtime_hours * 3600
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
 
         with self._cleanup_lock:
             stale_agents = []
             for agent_id, agent in self.agents.items():
-                if (current_time - agent.started_at) > max_runtime_seconds:
-                    if agent.process.poll() is None:  # Still running
+                if _elapsed(agent, now_ns) > max_runtime_seconds:
+                    if agent.return_code is None:  # Still running
                         stale_agents.append(agent_id)
 
             for agent_id in stale_agents:
@@ -539,11 +815,11 @@ class AgentSpawner:
 
     def get_resource_stats(self) -> Dict:
         """Get resource usage statistics"""
-        active_agents = sum(
-            1 for agent in self.agents.values() if agent.process.poll() is None
-        )
-        total_agents = len(self.agents)
-        queue_size = self.output_queue.qsize()
+        # Running agents are those the reaper has not yet seen exit
+        agents = self.agents
+        active_agents = sum(1 for agent in agents.values() if agent.return_code is None)
+        total_agents = len(agents)
+        queue_size = len(self.output_queue)
 
         return {
             "active_agents": active_agents,
@@ -2,6 +2,7 @@
 Agent type definitions and utilities
 """
 
+import re
 from enum import Enum
 from typing import List, Optional
 
@@ -23,6 +24,37 @@ class AgentType(Enum):
     SPECS_ENGINEER = "specifications-engineer"
 
 
+_AGENT_TYPES_BY_VALUE = {agent_type.value: agent_type for agent_type in AgentType}
+_SPECIALIZED_AGENTS = tuple(
+    t
+    for t in AgentType
+    if t not in (AgentType.CLAUDE, AgentType.CODEX, AgentType.GEMINI)
+)
+
+
+# Keyword groups for recommend_agent(), in priority order
+_KEYWORD_AGENTS = (
+    (("api", "backend", "server"), AgentType.BACKEND_ENGINEER),
+    (("ui", "frontend", "react", "vue"), AgentType.FRONTEND_ENGINEER),
+    (("data", "pipeline", "etl"), AgentType.DATA_PIPELINE),
+    (("ml", "model", "machine learning"), AgentType.ML_ARCHITECT),
+    (("aws", "cloud", "infrastructure"), AgentType.AWS_ARCHITECT),
+    (("spec", "requirement", "analysis"), AgentType.SPECS_ENGINEER),
+    (("llm", "chatbot", "ai"), AgentType.LLM_ARCHITECT),
+)
+_KEYWORD_RANKS = {
+    keyword: rank
+    for rank, (keywords, _) in enumerate(_KEYWORD_AGENTS)
+    for keyword in keywords
+}
+# Keywords are matched as substrings. The lookahead reports a match at every
+# position, overlapping ones included, and alternatives are tried in priority
+# order, so no higher-ranked keyword is hidden behind another
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORD_RANKS) + "))"
+)
+
+
 class AgentCapabilities:
     """Agent capabilities and metadata"""
 
@@ -112,38 +144,23 @@ class AgentCapabilities:
     @classmethod
     def from_string(cls, agent_str: str) -> Optional[AgentType]:
         """Convert string to AgentType"""
-        for agent_type in AgentType:
-            if agent_type.value == agent_str:
-                return agent_type
-        return None
+        return _AGENT_TYPES_BY_VALUE.get(agent_str)
 
     @classmethod
     def get_specialized_agents(cls) -> List[AgentType]:
         """Get list of specialized agents (excluding generic ones)"""
-        return [
-            t
-            for t in AgentType
-            if t not in (AgentType.CLAUDE, AgentType.CODEX, AgentType.GEMINI)
-        ]
+        return list(_SPECIALIZED_AGENTS)
 
     @classmethod
     def recommend_agent(cls, task_description: str) -> AgentType:
         """Recommend best agent type based on task description"""
-        task_lower = task_description.lower()
-
-        # Simple keyword-based recommendation
-        keywords_map = {
-            ("api", "backend", "server"): AgentType.BACKEND_ENGINEER,
-            ("ui", "frontend", "react", "vue"): AgentType.FRONTEND_ENGINEER,
-            ("data", "pipeline", "etl"): AgentType.DATA_PIPELINE,
-            ("ml", "model", "machine learning"): AgentType.ML_ARCHITECT,
-            ("aws", "cloud", "infrastructure"): AgentType.AWS_ARCHITECT,
-            ("spec", "requirement", "analysis"): AgentType.SPECS_ENGINEER,
-            ("llm", "chatbot", "ai"): AgentType.LLM_ARCHITECT,
-        }
-
-        for keywords, agent_type in keywords_map.items():
-            if any(keyword in task_lower for keyword in keywords):
-                return agent_type
+        # Simple keyword-based recommendation: one pass finds every keyword
+        # occurrence, and the earliest-listed keyword group wins
+        ranks = [
+            _KEYWORD_RANKS[match.group(1)]
+            for match in _KEYWORD_RE.finditer(task_description.lower())
+        ]
+        if ranks:
+            return _KEYWORD_AGENTS[min(ranks)][1]
 
         return AgentType.CLAUDE  # Default fallback
@@ -3,17 +3,23 @@ Autonomous Harness for long-running agent tasks
 
 Enhanced with parallel tool execution capabilities for improved throughput.
 """
-import json
+import os
+import re
 import time
+import hashlib
 import logging
 import threading
+import queue
 import signal
 import sys
-from typing import List, Dict, Any, Optional, Set
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
 
+from . import json_utils
 from .agent_api import AgentAPI
 from .tools import get_tool_definitions, get_tool_map, Tool
 from pathlib import Path
@@ -23,21 +29,54 @@ logger = logging.getLogger(__name__)
 # Load settings
 SETTINGS_PATH = Path(__file__).parent.parent.parent / "config" / "settings.json"
 try:
-    with open(SETTINGS_PATH, "r") as f:
-        SETTINGS = json.load(f)
+    with open(SETTINGS_PATH, "rb") as f:
+        SETTINGS = json_utils.loads(f.read())
 except Exception:
     SETTINGS = {
         "auto_mode": False,
         "max_loops": None,
         "allow_list": ["read_file"],
         "supervisor_interval_seconds": 5,
-        "context_pruning_threshold_chars": 100000
+        "context_pruning_threshold_chars": 100000,
+        "context_sink_messages": 4,
+        "context_window_messages": 10,
     }
 
+# Lines worth keeping from the middle of a summarized tool result
+_IMPORTANT_LINE_RE = re.compile(r"(?i)error|traceback|exception|fail|warn|panic|fatal|\bE\d{3}\b")
+# Marker and trailing tag _summarize_tool_result adds to a summary
+_SUMMARY_SNIP = "\n...[snip]...\n"
+_SUMMARY_TAG_RE = re.compile(r"\n\[\.\.\. summarized from \d+ chars \.\.\.\]\Z")
+
 # Constants for context management
 MAX_RESULT_SIZE = 100 * 1024  # 100KB max for single tool result
 MAX_MESSAGE_SIZE = 50 * 1024  # 50KB max per message
 TOOL_RESULT_SUMMARY_LENGTH = 500  # Chars to keep from large tool results
+MESSAGE_OVERHEAD_CHARS = 32  # Size estimate for a message's role and framing
+BLOCK_OVERHEAD_CHARS = 48  # Size estimate for a content block's type/id keys
+PRUNE_TARGET_RATIO = 0.5  # Prune down to this fraction of the threshold
+TOOL_CACHE_SIZE = 512  # Max cached tool results per harness (LRU)
+SUBPROCESS_TOOLS = {"bash"}  # Tools that run in their own small pool
+SUBPROCESS_POOL_SIZE = max(1, min(2, os.cpu_count() or 1))
+# run_task passes its own message list to chat_completion on whatever client
+# the caller injects as agent_api (AgentAPI itself has no chat_completion).
+# That client must only read the list; set this if it modifies it in place
+AGENT_API_MUTATES_MESSAGES = False
+
+# Tool instances and API definitions shared by every harness (tools hold no
+# per-harness state); read-only views so no harness can change them for all
+_TOOL_MAP: Optional[Mapping[str, Tool]] = None
+_TOOLS_DEF: Optional[Tuple[Dict[str, Any], ...]] = None
+
+
+def _get_cached_tools() -> Tuple[Mapping[str, Tool], Tuple[Dict[str, Any], ...]]:
+    """Tool map and tool definitions, built on first use"""
+    global _TOOL_MAP, _TOOLS_DEF
+    if _TOOL_MAP is None:
+        # A racing first call just builds an identical pair
+        _TOOLS_DEF = tuple(get_tool_definitions())
+        _TOOL_MAP = MappingProxyType(get_tool_map())
+    return _TOOL_MAP, _TOOLS_DEF
 
 
 class ExecutionMode(Enum):
@@ -54,7 +93,12 @@ class ToolExecutionResult:
     tool_name: str
     success: bool
     result: str
-    execution_time: float
+    execution_time_ns: int
+
+    @property
+    def execution_time(self) -> float:
+        """Execution time in seconds"""
+        return self.execution_time_ns / 1e9
 
 
 class AutonomousHarness:
@@ -65,6 +109,9 @@ class AutonomousHarness:
     multiple independent tools are called in a single step.
 
     Now supports 24/7 operation with Supervisor loop.
+
+    An instance has a single owner: messages are only touched by the thread
+    running run_task (tool workers never see them), so they need no lock.
     """
 
     # Tools that must be executed serially (have side effects on shared state)
@@ -76,6 +123,10 @@ class AutonomousHarness:
     # Tools allowed to auto-run in 24/7 mode
     ALLOW_LIST: Set[str] = set(SETTINGS.get("allow_list", []))
 
+    # Side-effect-free tools whose results are reused for identical input
+    # (keyed on the target file's mtime, so edits invalidate the entry)
+    CACHEABLE_TOOLS: Set[str] = {"read_file"}
+
     def __init__(
         self,
         agent_api: AgentAPI,
@@ -84,17 +135,80 @@ class AutonomousHarness:
     ):
         self.agent_api = agent_api
         self.messages: List[Dict[str, Any]] = []
-        self._message_lock = threading.Lock()  # Thread safety for message access
-        self.tool_map = get_tool_map()
-        self.tools_def = get_tool_definitions()
+        # Estimated size of each message, kept in step with self.messages so
+        # pruning never has to re-measure the transcript
+        self._msg_sizes: List[int] = []
+        self._total_chars = 0
+        # Length of the message prefix every prune keeps, set on first prune
+        self._prefix_len: Optional[int] = None
+        self.tool_map, self.tools_def = _get_cached_tools()
         self.execution_mode = execution_mode
         self.max_parallel_tools = max_parallel_tools
 
-        # Statistics
+        # Statistics, updated only by the thread running run_task
         self.total_tool_calls = 0
         self.parallel_batches = 0
         self.serial_executions = 0
-        self.total_tool_time = 0.0
+        self.total_tool_time_ns = 0
+        self.tool_cache_hits = 0
+        self.deduped_tool_calls = 0
+
+        # Tool progress lines; workers only append, and the harness thread
+        # writes them out once per batch instead of each worker taking the
+        # stdout lock per line
+        self._log_buf: List[str] = []
+
+        # Tool result cache: key -> (result text, success), least recent first
+        self._tool_cache: "OrderedDict[str, Tuple[str, bool]]" = OrderedDict()
+        self._tool_cache_lock = threading.Lock()  # Parallel tools share it
+
+        # Pools live as long as the harness; threads are started on demand and
+        # reused across batches. Subprocess tools get their own small pool so a
+        # slow command can't hold up file reads in the same batch. Tools run
+        # concurrently, so Tool.execute must be thread-safe.
+        self._pools = {
+            "subprocess": ThreadPoolExecutor(
+                max_workers=SUBPROCESS_POOL_SIZE, thread_name_prefix="harness-bash"
+            ),
+            "io": ThreadPoolExecutor(
+                max_workers=max_parallel_tools, thread_name_prefix="harness-tool"
+            ),
+        }
+
+    @property
+    def total_tool_time(self) -> float:
+        """Total tool execution time in seconds"""
+        return self.total_tool_time_ns / 1e9
+
+    def reset(self):
+        """Clear messages and statistics so the harness can run a new task.
+
+        Tools, worker pools and the tool result cache are kept.
+        """
+        self._reset_messages()
+        self.total_tool_calls = 0
+        self.parallel_batches = 0
+        self.serial_executions = 0
+        self.total_tool_time_ns = 0
+        self.tool_cache_hits = 0
+        self.deduped_tool_calls = 0
+        self._log_buf = []
+
+    def _reset_messages(self):
+        """Start an empty transcript"""
+        self.messages = []
+        self._msg_sizes = []
+        self._total_chars = 0
+        self._prefix_len = None
+
+    def close(self):
+        """Release the tool worker threads"""
+        for pool in self._pools.values():
+            pool.shutdown(wait=False)
+
+    def __del__(self):
+        for pool in getattr(self, "_pools", {}).values():
+            pool.shutdown(wait=False)
 
     def run_task(
         self,
@@ -118,13 +232,12 @@ class AutonomousHarness:
             print(f"   ⚡ Parallel tool execution enabled (max {self.max_parallel_tools})")
 
         # Reset messages for new task
-        with self._message_lock:
-            self.messages = []
-            # Initial user message
-            self.messages.append({
-                "role": "user",
-                "content": f"You are an autonomous coding agent. Your task is: {task_description}\n\nYou have access to tools to execute bash commands, read files, and write files. Use them to investigate and solve the problem."
-            })
+        self._reset_messages()
+        # Initial user message
+        self._append_message({
+            "role": "user",
+            "content": f"You are an autonomous coding agent. Your task is: {task_description}\n\nYou have access to tools to execute bash commands, read files, and write files. Use them to investigate and solve the problem."
+        })
 
         step_count = 0
         task_started = time.time()
@@ -143,11 +256,12 @@ class AutonomousHarness:
 
             # Call API
             try:
-                with self._message_lock:
-                    messages_copy = self.messages.copy()
+                messages = self.messages
+                if AGENT_API_MUTATES_MESSAGES:
+                    messages = messages.copy()
 
                 response_message = self.agent_api.chat_completion(
-                    messages=messages_copy,
+                    messages=messages,
                     tools=self.tools_def
                 )
             except Exception as e:
@@ -156,8 +270,7 @@ class AutonomousHarness:
                 break
 
             # Add assistant response to history
-            with self._message_lock:
-                self.messages.append(response_message)
+            self._append_message(response_message)
 
             # Check content
             content_blocks = response_message.get("content", [])
@@ -167,28 +280,40 @@ class AutonomousHarness:
                 print(f"🤖 {content_blocks}")
                 break
 
-            tool_calls = [b for b in content_blocks if b.get("type") == "tool_use"]
-            text_blocks = [b for b in content_blocks if b.get("type") == "text"]
-
-            for txt in text_blocks:
-                print(f"🤖 {txt.get('text')}")
+            # One pass: print text, collect tool calls and what the
+            # parallelization check needs to know about them
+            tool_calls = []
+            has_serial_only = False
+            edit_paths: List[str] = []
+            for block in content_blocks:
+                block_type = block.get("type")
+                if block_type == "tool_use":
+                    tool_calls.append(block)
+                    name = block.get("name")
+                    if name in self.SERIAL_ONLY_TOOLS:
+                        has_serial_only = True
+                    if name == "edit_file":
+                        edit_paths.append(block.get("input", {}).get("path", ""))
+                elif block_type == "text":
+                    print(f"🤖 {block.get('text')}")
 
             if not tool_calls:
                 print("✅ No more tools to run. Task considered complete.")
                 break
 
             # Execute tools (parallel or serial based on settings)
-            if parallel and self._can_parallelize_tools(tool_calls):
+            if parallel and self._can_parallelize_tools(
+                tool_calls, has_serial_only=has_serial_only, edit_paths=edit_paths
+            ):
                 tool_results = self._execute_tools_parallel(tool_calls)
             else:
                 tool_results = self._execute_tools_serial(tool_calls)
 
             # Append tool results to history
-            with self._message_lock:
-                self.messages.append({
-                    "role": "user",
-                    "content": tool_results
-                })
+            self._append_message({
+                "role": "user",
+                "content": tool_results
+            })
 
         task_duration = time.time() - task_started
 
@@ -203,7 +328,12 @@ class AutonomousHarness:
             "completed": step_count < max_steps if max_steps else True,
         }
 
-    def _can_parallelize_tools(self, tool_calls: List[Dict]) -> bool:
+    def _can_parallelize_tools(
+        self,
+        tool_calls: List[Dict],
+        has_serial_only: Optional[bool] = None,
+        edit_paths: Optional[List[str]] = None,
+    ) -> bool:
         """
         Determine if tool calls can be executed in parallel.
 
@@ -212,6 +342,9 @@ class AutonomousHarness:
         2. If any tool is in SERIAL_ONLY_TOOLS, return False if there are conflicts
         3. If execution_mode is PARALLEL, always return True (user knows best)
         4. If execution_mode is AUTO, analyze tool independence
+
+        has_serial_only and edit_paths (the paths of the edit_file calls, in
+        order) can be passed when the caller already collected them.
         """
         if self.execution_mode == ExecutionMode.SERIAL:
             return False
@@ -223,30 +356,32 @@ class AutonomousHarness:
             return True
 
         # AUTO mode: analyze tool calls
-        tool_names = [tc.get("name") for tc in tool_calls]
-
-        # Check if any tool is serial-only
-        if any(name in self.SERIAL_ONLY_TOOLS for name in tool_names):
-            # Check for file conflicts in edit operations
-            edit_paths = set()
-            for tc in tool_calls:
-                if tc.get("name") == "edit_file":
-                    path = tc.get("input", {}).get("path", "")
-                    if path in edit_paths:
-                        return False  # Same file edited twice, must be serial
-                    edit_paths.add(path)
-
-            # If editing different files, can still parallelize
-            if len(edit_paths) > 1:
-                return True
-            # If there's only one edit, parallelize with reads
-            return len(tool_calls) > len(edit_paths)
-
-        # All tools are parallelizable
-        return all(
-            name in self.PARALLELIZABLE_TOOLS or name not in self.SERIAL_ONLY_TOOLS
-            for name in tool_names
-        )
+        if has_serial_only is None:
+            has_serial_only = any(
+                tc.get("name") in self.SERIAL_ONLY_TOOLS for tc in tool_calls
+            )
+
+        # Fast path (most batches, e.g. all reads): with no serial-only tool
+        # every call is independent
+        if not has_serial_only:
+            return True
+
+        # Check for file conflicts in edit operations
+        if edit_paths is None:
+            edit_paths = [
+                tc.get("input", {}).get("path", "")
+                for tc in tool_calls
+                if tc.get("name") == "edit_file"
+            ]
+        unique_paths = set(edit_paths)
+        if len(unique_paths) < len(edit_paths):
+            return False  # Same file edited twice, must be serial
+
+        # If editing different files, can still parallelize
+        if len(unique_paths) > 1:
+            return True
+        # If there's only one edit, parallelize with reads
+        return len(tool_calls) > len(unique_paths)
 
     def _execute_tools_serial(self, tool_calls: List[Dict]) -> List[Dict]:
         """Execute tools one by one (original behavior)"""
@@ -255,67 +390,102 @@ class AutonomousHarness:
 
         for tc in tool_calls:
             result = self._execute_single_tool(tc)
+            self.total_tool_calls += 1
+            self.total_tool_time_ns += result.execution_time_ns
             tool_results.append({
                 "type": "tool_result",
                 "tool_use_id": result.tool_id,
                 "content": result.result
             })
 
+        self._flush_log()
         return tool_results
 
     def _execute_tools_parallel(self, tool_calls: List[Dict]) -> List[Dict]:
         """Execute multiple tools concurrently"""
         self.parallel_batches += 1
-        tool_results: List[Dict] = []
-        result_map: Dict[str, ToolExecutionResult] = {}
+        # One slot per call, filled as calls complete, so results keep the
+        # order of the tool calls
+        tool_results: List[Optional[Dict]] = [None] * len(tool_calls)
 
         print(f"   ⚡ Executing {len(tool_calls)} tools in parallel")
 
-        with ThreadPoolExecutor(max_workers=min(len(tool_calls), self.max_parallel_tools)) as executor:
-            futures = {
-                executor.submit(self._execute_single_tool, tc): tc.get("id")
-                for tc in tool_calls
-            }
-
-            for future in as_completed(futures):
-                tool_id = futures[future]
-                try:
-                    result = future.result()
-                    result_map[tool_id] = result
-                except Exception as e:
-                    logger.error(f"Tool execution error for {tool_id}: {e}", exc_info=True)
-                    result_map[tool_id] = ToolExecutionResult(
-                        tool_id=tool_id,
-                        tool_name="unknown",
-                        success=False,
-                        result=f"Error: {e}",
-                        execution_time=0.0,
-                    )
-
-        # Maintain original order of tool calls
-        for tc in tool_calls:
-            tool_id = tc.get("id")
-            if tool_id in result_map:
-                tool_results.append({
+        # Identical calls to side-effect-free tools run once; the result is
+        # given to every call in the group
+        groups: Dict[Any, List[int]] = {}
+        for i, tc in enumerate(tool_calls):
+            if tc.get("name") in self.CACHEABLE_TOOLS:
+                key = (tc["name"], json_utils.dumps(tc.get("input", {}), sort_keys=True))
+            else:
+                key = i
+            groups.setdefault(key, []).append(i)
+
+        futures = {
+            self._pool_for(tool_calls[indices[0]]).submit(
+                self._execute_single_tool, tool_calls[indices[0]]
+            ): indices
+            for indices in groups.values()
+        }
+        self.deduped_tool_calls += len(tool_calls) - len(futures)
+        self.total_tool_calls += len(futures)
+
+        # Worker times are summed here rather than in the workers, so the
+        # counter has a single writer
+        batch_time_ns = 0
+        for future in as_completed(futures):
+            indices = futures[future]
+            try:
+                result = future.result()
+                content = result.result
+                batch_time_ns += result.execution_time_ns
+            except Exception as e:
+                tool_id = tool_calls[indices[0]].get("id")
+                logger.error(f"Tool execution error for {tool_id}: {e}", exc_info=True)
+                content = f"Error: {e}"
+            for idx in indices:
+                tool_results[idx] = {
                     "type": "tool_result",
-                    "tool_use_id": tool_id,
-                    "content": result_map[tool_id].result
-                })
+                    "tool_use_id": tool_calls[idx].get("id"),
+                    "content": content
+                }
+        self.total_tool_time_ns += batch_time_ns
 
+        self._flush_log()
         return tool_results
 
+    def _log(self, line: str):
+        """Queue a tool progress line (safe from worker threads)"""
+        self._log_buf.append(line)
+
+    def _flush_log(self):
+        """Write queued progress lines in one call"""
+        if self._log_buf:
+            lines, self._log_buf = self._log_buf, []
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def _pool_for(self, tc: Dict) -> ThreadPoolExecutor:
+        """Pick the executor for a tool call by tool class"""
+        if tc.get("name") in SUBPROCESS_TOOLS:
+            return self._pools["subprocess"]
+        return self._pools["io"]
+
     def _execute_single_tool(self, tc: Dict) -> ToolExecutionResult:
         """Execute a single tool and return structured result"""
         tool_name = tc.get("name")
         tool_id = tc.get("id")
         tool_input = tc.get("input", {})
 
-        self.total_tool_calls += 1
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+
+        self._log(f"🛠️ Executing {tool_name}...")
 
-        print(f"🛠️ Executing {tool_name}...")
+        cache_key = self._tool_cache_key(tool_name, tool_input)
+        cached = self._get_cached_tool_result(cache_key)
 
-        if tool_name in self.tool_map:
+        if cached is not None:
+            result_text, success = cached
+        elif tool_name in self.tool_map:
             tool = self.tool_map[tool_name]
             try:
                 result_text = tool.execute(**tool_input)
@@ -330,23 +500,59 @@ class AutonomousHarness:
 
         # Truncate large results to prevent memory issues
         if len(result_text) > MAX_RESULT_SIZE:
-            truncated_msg = f"\n\n[... Result truncated from {len(result_text)} to {MAX_RESULT_SIZE} chars ...]"
-            result_text = result_text[:MAX_RESULT_SIZE] + truncated_msg
-            logger.warning(f"Tool {tool_name} result truncated from {len(result_text)} chars")
+            original_len = len(result_text)
+            result_text = self._summarize_tool_result(result_text, MAX_RESULT_SIZE)
+            logger.warning(f"Tool {tool_name} result truncated from {original_len} chars")
 
-        execution_time = time.time() - start_time
-        self.total_tool_time += execution_time
+        if cached is None and cache_key is not None and success:
+            self._store_tool_result(cache_key, result_text, success)
 
-        print(f"   -> Result len: {len(result_text)} chars ({execution_time:.2f}s)")
+        execution_time_ns = time.monotonic_ns() - start_ns
+
+        self._log(f"   -> Result len: {len(result_text)} chars ({execution_time_ns / 1e9:.2f}s)")
 
         return ToolExecutionResult(
             tool_id=tool_id,
             tool_name=tool_name,
             success=success,
             result=result_text,
-            execution_time=execution_time,
+            execution_time_ns=execution_time_ns,
         )
 
+    def _tool_cache_key(self, tool_name: str, tool_input: Dict) -> Optional[str]:
+        """Cache key for a cacheable tool call, or None if it must run"""
+        if tool_name not in self.CACHEABLE_TOOLS:
+            return None
+        try:
+            # The file's mtime and size are part of the key, so a rewrite of
+            # the file (by edit_file or anything else) misses the cache
+            stat = os.stat(tool_input.get("path", ""))
+        except (OSError, TypeError, ValueError):
+            return None
+        payload = json_utils.dumps_bytes(
+            [tool_name, tool_input, stat.st_mtime_ns, stat.st_size], sort_keys=True
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _get_cached_tool_result(self, key: Optional[str]) -> Optional[Tuple[str, bool]]:
+        """Look up a cached tool result, marking it most recently used"""
+        if key is None:
+            return None
+        with self._tool_cache_lock:
+            cached = self._tool_cache.get(key)
+            if cached is not None:
+                self._tool_cache.move_to_end(key)
+                self.tool_cache_hits += 1
+            return cached
+
+    def _store_tool_result(self, key: str, result_text: str, success: bool):
+        """Cache a tool result, evicting the least recently used entry"""
+        with self._tool_cache_lock:
+            self._tool_cache[key] = (result_text, success)
+            self._tool_cache.move_to_end(key)
+            if len(self._tool_cache) > TOOL_CACHE_SIZE:
+                self._tool_cache.popitem(last=False)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get execution statistics"""
         return {
@@ -355,6 +561,8 @@ class AutonomousHarness:
             "serial_executions": self.serial_executions,
             "total_tool_time": self.total_tool_time,
             "avg_tool_time": self.total_tool_time / max(1, self.total_tool_calls),
+            "tool_cache_hits": self.tool_cache_hits,
+            "deduped_tool_calls": self.deduped_tool_calls,
             "execution_mode": self.execution_mode.value,
             "max_parallel_tools": self.max_parallel_tools,
         }
@@ -365,40 +573,162 @@ class AutonomousHarness:
 
         Strategy:
         1. Truncate individual oversized messages
-        2. Keep first message (system/task)
+        2. Keep a stable prefix: the first context_sink_messages messages
+           (task description and early clarifications) and more if they fit
         3. Keep tool result summaries rather than full results
-        4. Keep recent messages in full
+        4. Keep the last context_window_messages messages in full
+
+        Pruning drops the oldest messages after the prefix until the context
+        is well under the threshold, not just under it. The kept prefix is
+        the same at every prune and prunes are rare, so the provider's prompt
+        prefix cache keeps hitting between them.
         """
         threshold = SETTINGS.get("context_pruning_threshold_chars", 100000)
 
-        with self._message_lock:
-            # First pass: truncate individual oversized messages
-            for msg in self.messages:
-                msg_str = str(msg)
-                if len(msg_str) > MAX_MESSAGE_SIZE:
-                    # For user messages with tool results, summarize them
-                    if msg.get("role") == "user" and isinstance(msg.get("content"), list):
-                        for block in msg["content"]:
-                            if block.get("type") == "tool_result":
-                                content = block.get("content", "")
-                                if len(content) > TOOL_RESULT_SUMMARY_LENGTH:
-                                    summary = content[:TOOL_RESULT_SUMMARY_LENGTH] + f"\n[... truncated {len(content) - TOOL_RESULT_SUMMARY_LENGTH} chars ...]"
-                                    block["content"] = summary
+        # First pass: truncate individual oversized messages
+        for i, msg in enumerate(self.messages):
+            if self._msg_sizes[i] > MAX_MESSAGE_SIZE:
+                # For user messages with tool results, summarize them
+                # (blocks already summarized are left alone, so the bytes of
+                # the kept prefix don't change from one step to the next)
+                if msg.get("role") == "user" and isinstance(msg.get("content"), list):
+                    changed = False
+                    for block in msg["content"]:
+                        if block.get("type") == "tool_result":
+                            content = block.get("content", "")
+                            if len(content) > TOOL_RESULT_SUMMARY_LENGTH and not (
+                                self._is_summary(content, TOOL_RESULT_SUMMARY_LENGTH)
+                            ):
+                                block["content"] = self._summarize_tool_result(
+                                    content, TOOL_RESULT_SUMMARY_LENGTH
+                                )
+                                changed = True
+                    if changed:
+                        self._set_message_size(i, self._estimate_size(msg))
+
+        current_chars = self._total_chars
+
+        if current_chars > threshold:
+            print(f"🧹 Pruning context ({current_chars} > {threshold} chars)...")
+
+            # Drop middle messages, oldest first, down to the target size,
+            # always keeping the prefix and the recent window
+            target = int(threshold * PRUNE_TARGET_RATIO)
+            start = self._stable_prefix_len(threshold)
+            last_droppable = len(self.messages) - SETTINGS.get("context_window_messages", 10)
+            end = start
+            new_chars = current_chars
+            while end < last_droppable and new_chars > target:
+                new_chars -= self._msg_sizes[end]
+                end += 1
+
+            # Don't orphan tool results: keep the tool_use they answer (with
+            # no recent window, end can run off the end of the list)
+            if start < end < len(self.messages) and self._has_tool_results(
+                self.messages[end]
+            ):
+                end -= 1
+                new_chars += self._msg_sizes[end]
+
+            if end > start:
+                del self.messages[start:end]
+                del self._msg_sizes[start:end]
+                self._total_chars = new_chars
+                print(f"   -> Pruned {end - start} messages ({current_chars} -> {new_chars} chars)")
+
+    def _stable_prefix_len(self, threshold: int) -> int:
+        """Number of leading messages kept by every prune of this task.
+
+        Fixed at the first prune: the first context_sink_messages messages,
+        extended while the prefix fits in stable_prefix_chars (30% of the
+        threshold by default), plus the tool results answering a tool_use at
+        its end. Pruning only deletes messages after it, so it stays put.
+        """
+        if self._prefix_len is None:
+            budget = SETTINGS.get("stable_prefix_chars", int(threshold * 0.3))
+            length = min(SETTINGS.get("context_sink_messages", 4), len(self.messages))
+            used = sum(self._msg_sizes[:length])
+            while length < len(self.messages) and used + self._msg_sizes[length] <= budget:
+                used += self._msg_sizes[length]
+                length += 1
+            if length < len(self.messages) and self._has_tool_results(self.messages[length]):
+                length += 1
+            self._prefix_len = length
+        return self._prefix_len
+
+    @staticmethod
+    def _has_tool_results(msg: Dict[str, Any]) -> bool:
+        """Whether a message answers tool_use blocks of the message before it"""
+        content = msg.get("content")
+        return isinstance(content, list) and any(
+            block.get("type") == "tool_result" for block in content
+        )
 
-            current_chars = sum(len(str(m)) for m in self.messages)
+    @staticmethod
+    def _summarize_tool_result(text: str, budget: int) -> str:
+        """
+        Shorten a tool result to roughly `budget` chars, keeping what matters.
 
-            if current_chars > threshold:
-                print(f"🧹 Pruning context ({current_chars} > {threshold} chars)...")
+        Keeps the first and last third of the budget in full (commands tend to
+        report results and errors at the end) and, from the middle, lines that
+        mention errors, warnings or tracebacks, as far as the rest allows.
+        """
+        if len(text) <= budget:
+            return text
+
+        edge = budget // 3
+        middle_budget = budget - 2 * edge
+        picked = []
+        for line in text[edge:-edge].splitlines():
+            if len(line) < middle_budget and _IMPORTANT_LINE_RE.search(line):
+                picked.append(line)
+                middle_budget -= len(line) + 1
+
+        middle = _SUMMARY_SNIP + "\n".join(picked) if picked else ""
+        return (
+            f"{text[:edge]}{middle}{_SUMMARY_SNIP}{text[-edge:]}"
+            f"\n[... summarized from {len(text)} chars ...]"
+        )
 
-                if len(self.messages) > 10:
-                    # Keep first message (task description) and last 10 messages
-                    # This preserves recent context while removing old middle messages
-                    kept_messages = [self.messages[0]] + self.messages[-10:]
-                    removed_count = len(self.messages) - len(kept_messages)
-                    self.messages = kept_messages
+    @staticmethod
+    def _is_summary(text: str, budget: int) -> bool:
+        """Whether text is already a _summarize_tool_result summary to `budget`
 
-                    new_chars = sum(len(str(m)) for m in self.messages)
-                    print(f"   -> Pruned {removed_count} messages ({current_chars} -> {new_chars} chars)")
+        A summary keeps at most `budget` chars of the original, plus two snip
+        markers and its trailing tag.
+        """
+        tag = _SUMMARY_TAG_RE.search(text)
+        return tag is not None and tag.start() <= budget + 2 * len(_SUMMARY_SNIP)
+
+    @staticmethod
+    def _estimate_size(msg: Dict[str, Any]) -> int:
+        """Approximate size of a message in characters, without a full repr"""
+        content = msg.get("content", "")
+        if isinstance(content, str):
+            return MESSAGE_OVERHEAD_CHARS + len(content)
+
+        size = MESSAGE_OVERHEAD_CHARS
+        for block in content:
+            if block.get("type") == "text":
+                size += len(block.get("text", ""))
+            elif block.get("type") == "tool_use":
+                size += len(str(block.get("input", "")))
+            else:
+                size += len(str(block.get("content", "")))
+            size += BLOCK_OVERHEAD_CHARS
+        return size
+
+    def _append_message(self, msg: Dict[str, Any]):
+        """Append a message, recording its size"""
+        size = self._estimate_size(msg)
+        self.messages.append(msg)
+        self._msg_sizes.append(size)
+        self._total_chars += size
+
+    def _set_message_size(self, index: int, size: int):
+        """Update the recorded size of a message changed in place"""
+        self._total_chars += size - self._msg_sizes[index]
+        self._msg_sizes[index] = size
 
 
 class Supervisor:
@@ -491,6 +821,8 @@ class ParallelAutonomousHarness(AutonomousHarness):
 
     IMPORTANT: The agent_api instance passed to this class MUST be thread-safe,
     or each subtask will create its own AgentAPI instance for isolation.
+    Message history needs no locking: each subtask runs in its own harness,
+    taken from a pool of max_parallel_agents harnesses and reset before use.
     """
 
     def __init__(
@@ -501,6 +833,38 @@ class ParallelAutonomousHarness(AutonomousHarness):
     ):
         super().__init__(agent_api, **kwargs)
         self.max_parallel_agents = max_parallel_agents
+        self._subtask_executor = ThreadPoolExecutor(
+            max_workers=max_parallel_agents, thread_name_prefix="harness-subtask"
+        )
+        # At most max_parallel_agents subtasks run at once, so that many
+        # harnesses serve any number of subtasks
+        self._harness_pool: "queue.Queue[AutonomousHarness]" = queue.Queue()
+        # Every pooled harness, including those a subtask has borrowed
+        self._pooled_harnesses: List[AutonomousHarness] = [
+            AutonomousHarness(
+                agent_api,  # Shared by all subtasks (must be thread-safe!)
+                execution_mode=self.execution_mode,
+                max_parallel_tools=self.max_parallel_tools,
+            )
+            for _ in range(max_parallel_agents)
+        ]
+        for harness in self._pooled_harnesses:
+            self._harness_pool.put(harness)
+        self._closed = False
+
+    def close(self):
+        """Release the tool and subtask worker threads"""
+        self._closed = True
+        super().close()
+        self._subtask_executor.shutdown(wait=False)
+        for harness in self._pooled_harnesses:
+            harness.close()
+
+    def __del__(self):
+        super().__del__()
+        executor = getattr(self, "_subtask_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def run_parallel_subtasks(
         self,
@@ -519,34 +883,31 @@ class ParallelAutonomousHarness(AutonomousHarness):
         Returns:
             List of results for each subtask
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         results = []
 
         print(f"🚀 Running {len(subtasks)} subtasks in parallel")
 
-        with ThreadPoolExecutor(max_workers=self.max_parallel_agents) as executor:
-            futures = {
-                executor.submit(self._run_subtask, subtask, max_steps_per_task): i
-                for i, subtask in enumerate(subtasks)
-            }
-
-            for future in as_completed(futures):
-                task_idx = futures[future]
-                try:
-                    result = future.result()
-                    results.append({
-                        "index": task_idx,
-                        "subtask": subtasks[task_idx],
-                        "result": result,
-                    })
-                except Exception as e:
-                    logger.error(f"Subtask {task_idx} failed: {e}", exc_info=True)
-                    results.append({
-                        "index": task_idx,
-                        "subtask": subtasks[task_idx],
-                        "error": str(e),
-                    })
+        futures = {
+            self._subtask_executor.submit(self._run_subtask, subtask, max_steps_per_task): i
+            for i, subtask in enumerate(subtasks)
+        }
+
+        for future in as_completed(futures):
+            task_idx = futures[future]
+            try:
+                result = future.result()
+                results.append({
+                    "index": task_idx,
+                    "subtask": subtasks[task_idx],
+                    "result": result,
+                })
+            except Exception as e:
+                logger.error(f"Subtask {task_idx} failed: {e}", exc_info=True)
+                results.append({
+                    "index": task_idx,
+                    "subtask": subtasks[task_idx],
+                    "error": str(e),
+                })
 
         # Sort by original index
         results.sort(key=lambda x: x.get("index", 0))
@@ -556,14 +917,20 @@ class ParallelAutonomousHarness(AutonomousHarness):
         """
         Run a single subtask in its own context.
 
-        NOTE: Creates a new AutonomousHarness instance for thread isolation.
-        If agent_api is thread-safe, we could reuse it, but creating new
-        instances is safer for avoiding race conditions.
+        NOTE: Borrows a harness from the pool for thread isolation; no other
+        subtask uses it until this one returns it.
         """
-        # Create new harness instance for complete isolation
-        harness = AutonomousHarness(
-            self.agent_api,  # Reuses same API client (must be thread-safe!)
-            execution_mode=self.execution_mode,
-            max_parallel_tools=self.max_parallel_tools,
-        )
-        return harness.run_task(subtask, max_steps=max_steps)
+        # Wait in short slices so a close() fails waiting subtasks fast
+        harness = None
+        while harness is None:
+            if self._closed:
+                raise RuntimeError("Harness is closed")
+            try:
+                harness = self._harness_pool.get(timeout=0.5)
+            except queue.Empty:
+                pass
+        try:
+            harness.reset()
+            return harness.run_task(subtask, max_steps=max_steps)
+        finally:
+            self._harness_pool.put(harness)
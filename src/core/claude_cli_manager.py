@@ -3,18 +3,99 @@ Centralized Claude CLI interaction manager
 Consolidates all Claude CLI calls to eliminate duplication
 """
 
+import functools
 import subprocess
 import shutil
-import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 import time
 
+from . import json_utils
 from .exceptions import safe_execute
 from .config import get_config
 from .input_validator import InputValidator, ValidationError
 
 
+# Agent types handed to Claude's Task tool by build_specialized_agent_prompt()
+SPECIALIZED_AGENT_TYPES = frozenset(
+    {
+        "data-pipeline-engineer",
+        "backend-systems-engineer",
+        "frontend-ui-engineer",
+        "data-science-analyst",
+        "aws-cloud-architect",
+        "ml-systems-architect",
+        "project-delivery-manager",
+        "data-architect-governance",
+        "llm-architect",
+        "specifications-engineer",
+    }
+)
+
+
+# Agent types offered by create_decomposition_prompt() when none are given
+_DEFAULT_AGENT_TYPES: Tuple[str, ...] = (
+    "claude",
+    "codex",
+    "data-pipeline-engineer",
+    "backend-systems-engineer",
+    "frontend-ui-engineer",
+    "data-science-analyst",
+    "aws-cloud-architect",
+    "ml-systems-architect",
+    "project-delivery-manager",
+    "data-architect-governance",
+    "llm-architect",
+    "specifications-engineer",
+)
+
+DECOMPOSITION_PROMPT_TEMPLATE = """Break down this task into {max_subtasks} or fewer specific subtasks.
+
+Task: {task_description}
+
+For each subtask, specify:
+1. A clear, actionable description
+2. Which agent type is best suited. Choose from:
+   - {agent_list}
+3. Any dependencies on other subtasks
+4. What context it needs from other subtasks
+
+Return as JSON array with format:
+[{{
+    "description": "Specific actionable task",
+    "agent_type": "<agent-type-from-above>",
+    "dependencies": ["subtask_1", "subtask_2"],
+    "context_needed": ["database_schema", "api_design"]
+}}]
+
+Focus on practical implementation steps. Be specific and actionable."""
+
+
+def _format_agent_list(agent_types) -> str:
+    """Render agent types as the bullet list used in the decomposition prompt"""
+    return "\n   - ".join(
+        f"{t}: Specialized for {t.replace('-', ' ')}" for t in agent_types
+    )
+
+
+_DEFAULT_AGENT_LIST = _format_agent_list(_DEFAULT_AGENT_TYPES)
+
+
+@functools.lru_cache(maxsize=32)
+def _specialized_prompt_frame(agent_type: str) -> Tuple[str, str]:
+    """Text placed before and after the task prompt for a specialized agent"""
+    head = (
+        f"Use the Task tool to launch a {agent_type} agent with the following task:\n\n"
+    )
+    tail = f"""
+
+IMPORTANT: You must use the Task tool with subagent_type='{agent_type}' to complete this task.
+Provide the task description and let the specialized agent handle the implementation.
+
+After the agent completes, summarize the results."""
+    return head, tail
+
+
 @dataclass
 class ClaudeResponse:
     """Structured response from Claude CLI"""
@@ -117,7 +198,7 @@ class ClaudeCLIManager:
         if not response.success or not response.content:
             return None
 
-        return safe_execute(lambda: json.loads(response.content), default=None)
+        return safe_execute(lambda: json_utils.loads(response.content), default=None)
 
     def call_claude_for_json(
         self, prompt: str, fallback_data: Any = None, timeout: Optional[int] = None
@@ -155,31 +236,11 @@ class ClaudeCLIManager:
         Returns:
             Enhanced prompt for specialized agent
         """
-        # Agent type mapping for specialized agents
-        specialized_agents = {
-            "data-pipeline-engineer",
-            "backend-systems-engineer",
-            "frontend-ui-engineer",
-            "data-science-analyst",
-            "aws-cloud-architect",
-            "ml-systems-architect",
-            "project-delivery-manager",
-            "data-architect-governance",
-            "llm-architect",
-            "specifications-engineer",
-        }
-
-        if agent_type not in specialized_agents:
+        if agent_type not in SPECIALIZED_AGENT_TYPES:
             return original_prompt
 
-        return f"""Use the Task tool to launch a {agent_type} agent with the following task:
-
-{original_prompt}
-
-IMPORTANT: You must use the Task tool with subagent_type='{agent_type}' to complete this task.
-Provide the task description and let the specialized agent handle the implementation.
-
-After the agent completes, summarize the results."""
+        head, tail = _specialized_prompt_frame(agent_type)
+        return head + original_prompt + tail
 
     def create_decomposition_prompt(
         self,
@@ -198,47 +259,17 @@ After the agent completes, summarize the results."""
         Returns:
             Formatted decomposition prompt
         """
-        if not agent_types:
-            agent_types = [
-                "claude",
-                "codex",
-                "data-pipeline-engineer",
-                "backend-systems-engineer",
-                "frontend-ui-engineer",
-                "data-science-analyst",
-                "aws-cloud-architect",
-                "ml-systems-architect",
-                "project-delivery-manager",
-                "data-architect-governance",
-                "llm-architect",
-                "specifications-engineer",
-            ]
-
-        agent_list = "\n   - ".join(
-            [f"{t}: Specialized for {t.replace('-', ' ')}" for t in agent_types]
+        if agent_types:
+            agent_list = _format_agent_list(agent_types)
+        else:
+            agent_list = _DEFAULT_AGENT_LIST
+
+        return DECOMPOSITION_PROMPT_TEMPLATE.format(
+            task_description=task_description,
+            max_subtasks=max_subtasks,
+            agent_list=agent_list,
         )
 
-        return f"""Break down this task into {max_subtasks} or fewer specific subtasks.
-
-Task: {task_description}
-
-For each subtask, specify:
-1. A clear, actionable description
-2. Which agent type is best suited. Choose from:
-   - {agent_list}
-3. Any dependencies on other subtasks
-4. What context it needs from other subtasks
-
-Return as JSON array with format:
-[{{
-    "description": "Specific actionable task",
-    "agent_type": "<agent-type-from-above>",
-    "dependencies": ["subtask_1", "subtask_2"],
-    "context_needed": ["database_schema", "api_design"]
-}}]
-
-Focus on practical implementation steps. Be specific and actionable."""
-
 
 # Global instance for shared use
 _claude_manager = None
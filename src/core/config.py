@@ -40,7 +40,11 @@ class OrchestratorConfig:
 
     def __post_init__(self):
         """Set derived paths and load from environment"""
-        # Load from environment
+        self._load_environment()
+        self._set_derived_paths()
+
+    def _load_environment(self):
+        """Apply environment overrides (read once, when the config is built)"""
         self.db_path = os.getenv("ORCHESTRATOR_DB_PATH", self.db_path)
         self.base_dir = os.getenv("ORCHESTRATOR_BASE_DIR", self.base_dir)
         self.max_agents = int(os.getenv("MAX_AGENTS", self.max_agents))
@@ -62,7 +66,8 @@ class OrchestratorConfig:
             except ValueError:
                 pass
 
-        # Set derived paths
+    def _set_derived_paths(self):
+        """Fill in directories derived from base_dir"""
         if not self.context_dir:
             self.context_dir = f"{self.base_dir}/context"
         if not self.planning_sessions_dir:
@@ -98,5 +103,7 @@ def update_config(**kwargs) -> OrchestratorConfig:
     for key, value in kwargs.items():
         if hasattr(config, key):
             setattr(config, key, value)
-    config.__post_init__()  # Recalculate derived values
+    # Only derived values are recalculated; the environment was applied when
+    # the config was built and must not override the values just set
+    config._set_derived_paths()
     return config
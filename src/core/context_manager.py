@@ -15,10 +15,29 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from contextlib import contextmanager
 
+from . import json_utils
 from .input_validator import InputValidator, ValidationError
 from .file_operations import FileOperations
 
 
+def _json_entries(dir_path: Path, suffix: str = ".json") -> List[os.DirEntry]:
+    """Regular files in dir_path whose names end with suffix.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no per-entry stat or Path object is needed. A missing
+    directory yields no entries.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [
+                entry
+                for entry in it
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 class ContextManager:
     """Thread-safe manager for shared context between agents using file-based storage"""
 
@@ -148,8 +167,14 @@ class ContextManager:
             except ValidationError:
                 return None
 
-    def set_task_context(self, task_id: str, context: Dict[str, Any]):
-        """Set context for a specific task (thread-safe)"""
+    def set_task_context(
+        self, task_id: str, context: Dict[str, Any], validate: bool = True
+    ):
+        """Set context for a specific task (thread-safe)
+
+        Pass validate=False when the caller has already run
+        InputValidator._validate_json_values() on this context.
+        """
         # Validate task_id
         try:
             safe_task_id = InputValidator.sanitize_agent_id(task_id)
@@ -160,10 +185,11 @@ class ContextManager:
         if not isinstance(context, dict):
             raise ValueError("Context must be a dictionary")
 
-        try:
-            InputValidator._validate_json_values(context)
-        except ValidationError as e:
-            raise ValueError(f"Invalid context: {e}")
+        if validate:
+            try:
+                InputValidator._validate_json_values(context)
+            except ValidationError as e:
+                raise ValueError(f"Invalid context: {e}")
 
         with self._task_lock:
             try:
@@ -262,24 +288,28 @@ class ContextManager:
                 output_dir = InputValidator.safe_path_join(
                     self.agent_outputs, safe_task_id
                 )
-                if not output_dir.exists():
-                    return []
-
-                outputs = []
-                for output_file in output_dir.glob("*.json"):
+                # Read every file first and parse once all reads are done.
+                # Writers hold _output_lock too, so no per-file lock is needed.
+                raw_outputs = []
+                for entry in _json_entries(output_dir):
                     # Validate each file path
                     try:
-                        validated_file = InputValidator.validate_file_path(output_file)
-                        with self._file_lock(validated_file):
-                            with open(validated_file, "r", encoding="utf-8") as f:
-                                outputs.append(json.load(f))
-                    except (OSError, json.JSONDecodeError, ValidationError):
+                        validated_file = InputValidator.validate_file_path(entry.path)
+                        with open(validated_file, "rb") as f:
+                            raw_outputs.append(f.read())
+                    except (OSError, ValidationError):
                         continue  # Skip invalid files
-
-                return sorted(outputs, key=lambda x: x.get("created_at", ""))
             except (ValidationError, OSError):
                 return []
 
+        outputs = []
+        for raw in raw_outputs:
+            try:
+                outputs.append(json_utils.loads(raw))
+            except json.JSONDecodeError:
+                continue  # Skip invalid files
+        return sorted(outputs, key=lambda x: x.get("created_at", ""))
+
     def share_document(self, doc_name: str, content: str, format: str = "md"):
         """Share a document between agents (thread-safe)"""
         # Validate inputs
@@ -326,17 +356,14 @@ class ContextManager:
 
                     # Also create metadata
                     with self._file_lock(meta_file):
-                        with open(meta_file, "w", encoding="utf-8") as f:
-                            json.dump(
-                                {
-                                    "name": safe_doc_name,
-                                    "format": format,
-                                    "size": len(content),
-                                    "created_at": datetime.now().isoformat(),
-                                },
-                                f,
-                                indent=2,
-                            )
+                        meta = {
+                            "name": safe_doc_name,
+                            "format": format,
+                            "size": len(content),
+                            "created_at": datetime.now().isoformat(),
+                        }
+                        with open(meta_file, "wb") as f:
+                            f.write(json_utils.dumps_bytes(meta, indent=True))
             except (OSError, ValidationError) as e:
                 raise ValueError(f"Cannot share document: {e}")
 
@@ -378,11 +405,12 @@ class ContextManager:
         """List all shared documents (thread-safe)"""
         with self._global_lock:
             docs = []
-            for meta_file in self.shared_docs.glob("*.meta.json"):
+            for entry in _json_entries(self.shared_docs, ".meta.json"):
+                meta_file = Path(entry.path)
                 try:
                     with self._file_lock(meta_file):
-                        with open(meta_file, "r") as f:
-                            docs.append(json.load(f))
+                        with open(meta_file, "rb") as f:
+                            docs.append(json_utils.loads(f.read()))
                 except (OSError, json.JSONDecodeError):
                     continue  # Skip invalid files
             return sorted(docs, key=lambda x: x.get("created_at", ""))
@@ -406,8 +434,8 @@ class ContextManager:
                 summary_file = InputValidator.safe_path_join(task_dir, "summary.json")
 
                 with self._file_lock(summary_file):
-                    with open(summary_file, "w") as f:
-                        json.dump(summary, f, indent=2)
+                    with open(summary_file, "wb") as f:
+                        f.write(json_utils.dumps_bytes(summary, indent=True))
             except (ValidationError, OSError):
                 pass  # Summary save failed, but return summary anyway
 
@@ -465,18 +493,15 @@ class ContextManager:
                 msg_file = InputValidator.safe_path_join(msg_dir, f"{msg_id}.json")
 
                 with self._file_lock(msg_file):
-                    with open(msg_file, "w", encoding="utf-8") as f:
-                        json.dump(
-                            {
-                                "id": msg_id,
-                                "sender": safe_sender,
-                                "recipients": recipients,
-                                "message": message,
-                                "timestamp": datetime.now().isoformat(),
-                            },
-                            f,
-                            indent=2,
-                        )
+                    msg = {
+                        "id": msg_id,
+                        "sender": safe_sender,
+                        "recipients": recipients,
+                        "message": message,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                    with open(msg_file, "wb") as f:
+                        f.write(json_utils.dumps_bytes(msg, indent=True))
             except (OSError, ValidationError) as e:
                 raise ValueError(f"Cannot broadcast message: {e}")
 
@@ -494,16 +519,15 @@ class ContextManager:
         with self._global_lock:
             try:
                 msg_dir = InputValidator.safe_path_join(self.base_dir, "messages")
-                if not msg_dir.exists():
-                    return []
 
                 messages = []
-                for msg_file in sorted(msg_dir.glob("*.json")):
+                entries = sorted(_json_entries(msg_dir), key=lambda e: e.name)
+                for entry in entries:
                     try:
-                        validated_file = InputValidator.validate_file_path(msg_file)
+                        validated_file = InputValidator.validate_file_path(entry.path)
                         with self._file_lock(validated_file):
-                            with open(validated_file, "r", encoding="utf-8") as f:
-                                msg = json.load(f)
+                            with open(validated_file, "rb") as f:
+                                msg = json_utils.loads(f.read())
 
                         # Filter by recipient
                         if (
@@ -554,28 +578,29 @@ class ContextManager:
         with self._global_lock, self._task_lock, self._output_lock:
             base_stats = FileOperations.get_directory_stats(self.base_dir)
 
-            # Count specific file types safely
-            global_contexts = len(
-                FileOperations.safe_list_files(self.global_context, "*.json")
-            )
-            tasks_with_context = len(
-                FileOperations.safe_list_files(self.task_contexts, "*")
-            )
-            agent_outputs = len(
-                FileOperations.safe_list_files(
-                    self.agent_outputs, "*.json", recursive=True
-                )
-            )
-            shared_docs = len(
-                FileOperations.safe_list_files(self.shared_docs, "*[!.meta].json")
-            )
-
-            messages_dir = self.base_dir / "messages"
-            messages = (
-                len(FileOperations.safe_list_files(messages_dir, "*.json"))
-                if messages_dir.exists()
-                else 0
+            # Count specific file types, one directory listing each
+            global_contexts = len(_json_entries(self.global_context))
+            try:
+                with os.scandir(self.task_contexts) as it:
+                    tasks_with_context = sum(1 for _ in it)
+            except FileNotFoundError:
+                tasks_with_context = 0
+            try:
+                with os.scandir(self.agent_outputs) as it:
+                    output_dirs = [
+                        entry.path
+                        for entry in it
+                        if entry.is_dir(follow_symlinks=False)
+                    ]
+            except FileNotFoundError:
+                output_dirs = []
+            agent_outputs = sum(len(_json_entries(d)) for d in output_dirs)
+            shared_docs = sum(
+                1
+                for entry in _json_entries(self.shared_docs)
+                if not entry.name.endswith(".meta.json")
             )
+            messages = len(_json_entries(self.base_dir / "messages"))
 
             return {
                 "global_contexts": global_contexts,
@@ -16,6 +16,9 @@ from .config import get_config
 class ConnectionPool:
     """Simple SQLite connection pool with resource limits"""
 
+    # Pooled connections are only re-validated after sitting idle this long
+    VALIDATE_INTERVAL_SECONDS = 30
+
     def __init__(self, db_path: str, pool_size: int = 5, timeout: int = 30):
         self.db_path = db_path
         self.pool_size = pool_size
@@ -23,6 +26,9 @@ class ConnectionPool:
         self.connections = deque()
         self.active_connections = 0
         self.lock = threading.Lock()
+        # Per-connection bookkeeping keyed by id(conn)
+        self._conn_checked_times = {}
+        self._conn_optimize_times = {}
 
         # Create initial connections
         for _ in range(min(2, pool_size)):  # Start with 2 connections
@@ -86,18 +92,21 @@ class ConnectionPool:
                 if conn is None:
                     raise TaskError("Database connection timeout")
 
-            # Verify connection is still valid and optimize if needed
+            # Verify connection is still valid and optimize if needed. Hot
+            # connections skip the probe so steady-state queries pay no extra
+            # round trip.
             try:
-                conn.execute("SELECT 1")
-                # Periodically optimize connections (store timestamp in a dict to avoid modifying conn object)
-                if not hasattr(self, "_conn_optimize_times"):
-                    self._conn_optimize_times = {}
-
                 conn_id = id(conn)
-                last_optimized = self._conn_optimize_times.get(conn_id, 0)
-                if time.time() - last_optimized > 3600:  # 1 hour
-                    conn.execute("PRAGMA optimize")
-                    self._conn_optimize_times[conn_id] = time.time()
+                now = time.time()
+                last_checked = self._conn_checked_times.get(conn_id, 0)
+                if now - last_checked > self.VALIDATE_INTERVAL_SECONDS:
+                    conn.execute("SELECT 1")
+                    # Periodically optimize connections (store timestamp in a dict to avoid modifying conn object)
+                    last_optimized = self._conn_optimize_times.get(conn_id, 0)
+                    if now - last_optimized > 3600:  # 1 hour
+                        conn.execute("PRAGMA optimize")
+                        self._conn_optimize_times[conn_id] = now
+                self._conn_checked_times[conn_id] = now
             except sqlite3.Error:
                 # Connection is stale, create a new one
                 try:
@@ -142,6 +151,8 @@ class ConnectionPool:
                 except sqlite3.Error:
                     pass
             self.active_connections = 0
+            self._conn_checked_times.clear()
+            self._conn_optimize_times.clear()
 
 
 class DatabaseManager:
@@ -167,6 +178,21 @@ class DatabaseManager:
         with self._pool.get_connection() as conn:
             yield conn
 
+    @contextmanager
+    def transaction(self):
+        """Yield a pooled connection inside a BEGIN IMMEDIATE transaction.
+
+        Commits when the block exits normally and rolls back on any exception.
+        """
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")  # Acquire write lock immediately
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
     def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query and return results"""
         with self.get_connection() as conn:
@@ -186,6 +212,20 @@ class DatabaseManager:
                 conn.rollback()
                 raise
 
+    def execute_many(self, query: str, params_seq: List[tuple]) -> int:
+        """Execute one INSERT/UPDATE/DELETE for many parameter sets in a single transaction"""
+        if not params_seq:
+            return 0
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.executemany(query, params_seq)
+                conn.commit()
+                return cursor.rowcount
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+
     def serialize_json(self, data: Any) -> str:
         """Safely serialize data to JSON"""
         return json.dumps(data) if data else "{}"
@@ -6,7 +6,7 @@ import json
 import uuid
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import time
 
 from .feedback_loop import (
@@ -18,6 +18,7 @@ from .feedback_loop import (
     DataScienceEvaluator,
     GeneralEvaluator,
 )
+from . import json_utils
 from .task_queue import TaskQueue
 from .agent_spawner import AgentSpawner
 from .context_manager import ContextManager
@@ -48,7 +49,7 @@ Previous attempt #{last_feedback.iteration}:
 {base_desc}
 
 Results:
-{json.dumps(metrics, indent=2)}
+{json_utils.dumps(metrics, indent=True)}
 
 Evaluation: {last_feedback.evaluation_result.value}
 
@@ -137,7 +138,7 @@ class GridSearchRefinementStrategy(RefinementStrategy):
         )
         self.current_combination += 1
 
-        return f"{task.description}\n\nUse these parameters:\n{json.dumps(params, indent=2)}"
+        return f"{task.description}\n\nUse these parameters:\n{json_utils.dumps(params, indent=True)}"
 
 
 class FeedbackOrchestrator:
@@ -194,6 +195,12 @@ class FeedbackOrchestrator:
             )
         """)
 
+        # Newest-first listing is served by an index range scan
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_validated_created
+            ON validated_tasks (created_at DESC)
+        """)
+
         conn.commit()
         conn.close()
 
@@ -233,7 +240,7 @@ class FeedbackOrchestrator:
                 task.task_id,
                 task.description,
                 task.agent_type,
-                json.dumps(task.success_criteria.to_dict()),
+                json_utils.dumps(task.success_criteria.to_dict()),
                 task.max_iterations,
                 0,
                 task.refinement_strategy,
@@ -355,7 +362,7 @@ class FeedbackOrchestrator:
             task_id=row[0],
             description=row[1],
             agent_type=row[2],
-            success_criteria=SuccessCriteria.from_dict(json.loads(row[3])),
+            success_criteria=SuccessCriteria.from_dict(json_utils.loads(row[3])),
             max_iterations=row[4],
             iteration_count=row[5],
             refinement_strategy=row[6],
@@ -369,7 +376,7 @@ class FeedbackOrchestrator:
                 iteration=fb_row[2],
                 timestamp=datetime.fromisoformat(fb_row[3]),
                 evaluation_result=EvaluationResult(fb_row[4]),
-                metrics=json.loads(fb_row[5]),
+                metrics=json_utils.loads(fb_row[5]),
                 refinement_applied=fb_row[6],
                 agent_output=fb_row[7],
             )
@@ -456,7 +463,7 @@ class FeedbackOrchestrator:
                 feedback.iteration,
                 feedback.timestamp,
                 feedback.evaluation_result.value,
-                json.dumps(feedback.metrics),
+                json_utils.dumps(feedback.metrics),
                 feedback.refinement_applied,
                 feedback.agent_output,
             ),
@@ -482,6 +489,21 @@ class FeedbackOrchestrator:
         conn.commit()
         conn.close()
 
+    def list_validated_tasks(self, limit: int = 10) -> List[Tuple]:
+        """Get (task_id, description, status, iteration_count, max_iterations)
+        rows for the most recently created validated tasks"""
+        # Reuse the task queue's pooled WAL connection
+        rows = self.task_queue.db.execute_query(
+            """
+            SELECT task_id, description, status, iteration_count, max_iterations
+            FROM validated_tasks
+            ORDER BY created_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return [tuple(row) for row in rows]
+
     def get_feedback_status(self, task_id: str) -> Dict[str, Any]:
         """Get current status of feedback loop"""
         task = self._load_validated_task(task_id)
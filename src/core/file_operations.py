@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 
+from . import json_utils
 from .input_validator import InputValidator, ValidationError
 
 
@@ -42,15 +43,15 @@ class FileOperations:
             if create_dirs:
                 safe_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
 
-            # Validate data is JSON serializable
+            # Serialize once up front: validates the data and gives the payload
             try:
-                json.dumps(data)
+                payload = json_utils.dumps_bytes(data, indent=True)
             except (TypeError, ValueError) as e:
                 raise ValidationError(f"Data is not JSON serializable: {e}")
 
             # Write file with secure permissions
-            with open(safe_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(safe_path, "wb") as f:
+                f.write(payload)
 
             # Set file permissions
             if hasattr(os, "chmod"):
@@ -58,7 +59,7 @@ class FileOperations:
 
             return True
 
-        except (OSError, ValidationError, json.JSONEncodeError):
+        except (OSError, ValidationError):
             return False
 
     @staticmethod
@@ -78,8 +79,8 @@ class FileOperations:
             if not safe_path.exists():
                 return None
 
-            with open(safe_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(safe_path, "rb") as f:
+                return json_utils.loads(f.read())
 
         except (OSError, json.JSONDecodeError, ValidationError):
             return None
@@ -143,9 +144,7 @@ class FileOperations:
         try:
             safe_path = InputValidator.validate_file_path(file_path)
 
-            if not safe_path.exists():
-                return None
-
+            # A missing file surfaces as FileNotFoundError from open()
             with open(safe_path, "r", encoding="utf-8") as f:
                 return f.read()
 
@@ -5,8 +5,9 @@ Provides secure input handling for the Agent Orchestrator
 
 import re
 import json
+import functools
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Tuple, Union
 import shlex
 
 
@@ -32,42 +33,84 @@ class InputValidator:
     MAX_PATH_LENGTH = 500
     MAX_JSON_SIZE = 100000  # 100KB
 
+    VALID_AGENT_TYPES = frozenset(
+        [
+            "claude",
+            "codex",
+            "gemini",
+            "data-pipeline-engineer",
+            "backend-systems-engineer",
+            "frontend-ui-engineer",
+            "data-science-analyst",
+            "aws-cloud-architect",
+            "ml-systems-architect",
+            "project-delivery-manager",
+            "data-architect-governance",
+            "llm-architect",
+            "specifications-engineer",
+            "any",
+        ]
+    )
+    VALID_PRIORITIES = frozenset(["high", "normal", "low"])
+
+    # Command injection patterns rejected in task descriptions, with the
+    # source text used in the error message
+    DANGEROUS_TASK_PATTERNS = tuple(
+        (pattern, re.compile(pattern))
+        for pattern in (
+            r"`[^`]*`",  # Backticks
+            r"\$\([^)]*\)",  # Command substitution
+            r"&&\s*\w+",  # Command chaining
+            r";\s*\w+",  # Command separation
+            r"\|\s*\w+",  # Pipes
+            r">\s*[/\w]",  # Redirects
+            r"<\s*[/\w]",  # Input redirects
+        )
+    )
+
     @staticmethod
     def sanitize_task_description(description: str) -> str:
         """Sanitize task description for safe processing"""
         if not isinstance(description, str):
             raise ValidationError("Task description must be a string")
 
+        sanitized, error = InputValidator._sanitize_task_description_cached(description)
+        if error is not None:
+            raise ValidationError(error)
+        return sanitized
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _sanitize_task_description_cached(
+        description: str,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Memoized body of sanitize_task_description for string inputs.
+
+        Returns (sanitized description, None), or (None, error message) for
+        a rejected description. The result depends only on the input, so
+        repeated descriptions (plan loops, retried prompts) skip the pattern
+        scan whether they pass or fail.
+        """
         if len(description) > InputValidator.MAX_TASK_DESCRIPTION_LENGTH:
-            raise ValidationError(
+            return None, (
                 f"Task description too long (max {InputValidator.MAX_TASK_DESCRIPTION_LENGTH} chars)"
             )
 
         if not description.strip():
-            raise ValidationError("Task description cannot be empty")
+            return None, "Task description cannot be empty"
 
         # Remove any null bytes
         description = description.replace("\x00", "")
 
         # Basic sanitization for shell safety
         # Remove potential command injection patterns
-        dangerous_patterns = [
-            r"`[^`]*`",  # Backticks
-            r"\$\([^)]*\)",  # Command substitution
-            r"&&\s*\w+",  # Command chaining
-            r";\s*\w+",  # Command separation
-            r"\|\s*\w+",  # Pipes
-            r">\s*[/\w]",  # Redirects
-            r"<\s*[/\w]",  # Input redirects
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, description):
-                raise ValidationError(
+        for pattern, regex in InputValidator.DANGEROUS_TASK_PATTERNS:
+            if regex.search(description):
+                return None, (
                     f"Task description contains potentially dangerous pattern: {pattern}"
                 )
 
-        return description.strip()
+        return description.strip(), None
 
     @staticmethod
     def sanitize_agent_id(agent_id: str) -> str:
@@ -219,24 +262,10 @@ class InputValidator:
     @staticmethod
     def validate_agent_type(agent_type: str) -> str:
         """Validate agent type against allowed values"""
-        valid_types = [
-            "claude",
-            "codex",
-            "gemini",
-            "data-pipeline-engineer",
-            "backend-systems-engineer",
-            "frontend-ui-engineer",
-            "data-science-analyst",
-            "aws-cloud-architect",
-            "ml-systems-architect",
-            "project-delivery-manager",
-            "data-architect-governance",
-            "llm-architect",
-            "specifications-engineer",
-            "any",
-        ]
-
-        if agent_type not in valid_types:
+        if (
+            not isinstance(agent_type, str)
+            or agent_type not in InputValidator.VALID_AGENT_TYPES
+        ):
             raise ValidationError(f"Invalid agent type: {agent_type}")
 
         return agent_type
@@ -244,9 +273,10 @@ class InputValidator:
     @staticmethod
     def validate_priority(priority: str) -> str:
         """Validate priority value"""
-        valid_priorities = ["high", "normal", "low"]
-
-        if priority not in valid_priorities:
+        if (
+            not isinstance(priority, str)
+            or priority not in InputValidator.VALID_PRIORITIES
+        ):
             raise ValidationError(f"Invalid priority: {priority}")
 
         return priority
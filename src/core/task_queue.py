@@ -5,7 +5,7 @@ No Redis, no external dependencies, just SQLite
 
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Sequence, Set, Tuple
 from enum import Enum
 import threading
 
@@ -80,34 +80,45 @@ class TaskQueue:
         """
         self.db.init_schema(schema)
 
-    def add_task(
+        # Serve the spawn loop's "next pending task" pick and agent lookups
+        # from indexes instead of full table scans
+        self.db.init_schema(
+            """
+            CREATE INDEX IF NOT EXISTS idx_tasks_pending_pick
+            ON tasks (status, agent_type, priority, created_at)
+            """
+        )
+        self.db.init_schema(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks (assigned_to)"
+        )
+
+    _INSERT_TASK_QUERY = """
+        INSERT INTO tasks (id, description, agent_type, status, priority,
+                          created_at, context)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _new_task_params(
         self,
         description: str,
-        agent_type: str = "any",
-        priority: Priority = Priority.NORMAL,
-        context: Dict = None,
-    ) -> str:
-        """Add a new task to the queue"""
+        agent_type: str,
+        priority: Priority,
+        context: Optional[Dict],
+    ) -> tuple:
+        """Build the INSERT parameters for a new task"""
         import uuid
 
         # Validate inputs
         description = validate_not_empty(description, "description")
 
-        task_id = str(uuid.uuid4())[:8]
         task = Task(
-            id=task_id,
+            id=str(uuid.uuid4())[:8],
             description=description,
             agent_type=agent_type,
             priority=priority.value,
             context=context or {},
         )
-
-        query = """
-            INSERT INTO tasks (id, description, agent_type, status, priority,
-                              created_at, context)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
-        params = (
+        return (
             task.id,
             task.description,
             task.agent_type,
@@ -117,29 +128,119 @@ class TaskQueue:
             self.db.serialize_json(task.context),
         )
 
-        self.db.execute_update(query, params)
-        return task_id
+    def add_task(
+        self,
+        description: str,
+        agent_type: str = "any",
+        priority: Priority = Priority.NORMAL,
+        context: Dict = None,
+    ) -> str:
+        """Add a new task to the queue"""
+        params = self._new_task_params(description, agent_type, priority, context)
+        self.db.execute_update(self._INSERT_TASK_QUERY, params)
+        return params[0]
+
+    def add_tasks(
+        self, tasks: List[Tuple[str, str, Priority, Optional[Dict]]]
+    ) -> List[str]:
+        """Add many (description, agent_type, priority, context) tasks at once"""
+        params_seq = [
+            self._new_task_params(description, agent_type, priority, context)
+            for description, agent_type, priority, context in tasks
+        ]
+        self.db.execute_many(self._INSERT_TASK_QUERY, params_seq)
+        return [params[0] for params in params_seq]
+
+    # Fixed query text lets sqlite3's per-connection statement cache reuse
+    # the prepared statement on every call
+    _NEXT_TASK_FOR_TYPE_QUERY = """
+        SELECT * FROM tasks
+        WHERE status = ? AND (agent_type = ? OR agent_type = 'any')
+        ORDER BY priority ASC, created_at ASC LIMIT 1
+    """
+    _NEXT_TASK_QUERY = """
+        SELECT * FROM tasks WHERE status = ?
+        ORDER BY priority ASC, created_at ASC LIMIT 1
+    """
 
     def get_next_task(self, agent_type: str = None) -> Optional[Task]:
         """Get next available task for an agent (thread-safe)"""
         with self._task_lock:
             if agent_type:
-                query = """
-                    SELECT * FROM tasks
-                    WHERE status = ? AND (agent_type = ? OR agent_type = 'any')
-                    ORDER BY priority ASC, created_at ASC LIMIT 1
-                """
+                query = self._NEXT_TASK_FOR_TYPE_QUERY
                 params = (TaskStatus.PENDING.value, agent_type)
             else:
-                query = """
-                    SELECT * FROM tasks WHERE status = ?
-                    ORDER BY priority ASC, created_at ASC LIMIT 1
-                """
+                query = self._NEXT_TASK_QUERY
                 params = (TaskStatus.PENDING.value,)
 
             rows = self.db.execute_query(query, params)
             return self._row_to_task(rows[0]) if rows else None
 
+    def pending_counts(self) -> Dict[str, int]:
+        """Count pending tasks per requested agent type in a single query"""
+        rows = self.db.execute_query(
+            """
+            SELECT agent_type, COUNT(*) as count FROM tasks
+            WHERE status = ? GROUP BY agent_type
+            """,
+            (TaskStatus.PENDING.value,),
+        )
+        return {row["agent_type"]: row["count"] for row in rows}
+
+    def pick_next_batch(
+        self, limit: int, agent_types: Sequence[str]
+    ) -> List[Tuple[Task, str]]:
+        """Atomically claim up to `limit` pending tasks in a single query.
+
+        Tasks are ordered the way calling get_next_task() for each entry of
+        `agent_types` in turn would pick them: by the position of their agent
+        type in `agent_types` ('any' ranks with the first type), then by
+        priority and age. Each claimed task is marked assigned to a
+        "<type>-agent" placeholder and returned with the agent type to run it.
+        """
+        if limit <= 0 or not agent_types:
+            return []
+
+        type_placeholders = ", ".join("?" for _ in agent_types)
+        rank_cases = " ".join(f"WHEN ? THEN {i}" for i in range(len(agent_types)))
+        query = f"""
+            SELECT * FROM tasks
+            WHERE status = ? AND agent_type IN ({type_placeholders}, 'any')
+            ORDER BY CASE agent_type WHEN 'any' THEN 0 {rank_cases} END,
+                     priority ASC, created_at ASC
+            LIMIT ?
+        """
+        params = (TaskStatus.PENDING.value, *agent_types, *agent_types, limit)
+
+        with self._assignment_lock:
+            with self.db.transaction() as conn:
+                rows = conn.execute(query, params).fetchall()
+                timestamp = datetime.now().isoformat()
+
+                claimed = []
+                for row in rows:
+                    task = self._row_to_task(row)
+                    run_as = task.agent_type
+                    if run_as == "any":
+                        run_as = agent_types[0]
+                    task.status = TaskStatus.ASSIGNED.value
+                    task.assigned_to = f"{run_as}-agent"
+                    task.assigned_at = timestamp
+                    claimed.append((task, run_as))
+
+                conn.executemany(
+                    """
+                    UPDATE tasks SET status = ?, assigned_to = ?, assigned_at = ?
+                    WHERE id = ?
+                    """,
+                    [
+                        (task.status, task.assigned_to, timestamp, task.id)
+                        for task, _ in claimed
+                    ],
+                )
+
+        return claimed
+
     def assign_task(self, task_id: str, agent_id: str) -> bool:
         """Atomically assign a task to an agent (thread-safe)"""
         with self._assignment_lock:
@@ -186,6 +287,43 @@ class TaskQueue:
 
             return self.db.execute_update(query, params) > 0
 
+    def update_statuses(
+        self, updates: List[Tuple[str, TaskStatus, Optional[str], Optional[str]]]
+    ) -> int:
+        """Apply many (task_id, status, result, error) updates in one transaction.
+
+        Mirrors update_status() per row, but commits once for the whole batch.
+        Returns the number of tasks updated.
+        """
+        if not updates:
+            return 0
+
+        with self._task_lock:
+            timestamp = datetime.now().isoformat()
+            query = """
+                UPDATE tasks SET status = ?,
+                    assigned_at = COALESCE(?, assigned_at),
+                    completed_at = COALESCE(?, completed_at),
+                    result = COALESCE(?, result),
+                    error = COALESCE(?, error)
+                WHERE id = ?
+            """
+            params_seq = []
+            for task_id, status, result, error in updates:
+                terminal = status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
+                params_seq.append(
+                    (
+                        status.value,
+                        timestamp if status == TaskStatus.IN_PROGRESS else None,
+                        timestamp if terminal else None,
+                        (result or None) if terminal else None,
+                        (error or None) if terminal else None,
+                        task_id,
+                    )
+                )
+
+            return self.db.execute_many(query, params_seq)
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a specific task by ID (thread-safe)"""
         with self._task_lock:
@@ -205,12 +343,56 @@ class TaskQueue:
             rows = self.db.execute_query(query, params)
             return [self._row_to_task(row) for row in rows]
 
+    def get_recent_tasks(self, limit: int = 5) -> List[Task]:
+        """Get the `limit` most recently created tasks (thread-safe)"""
+        with self._task_lock:
+            query = "SELECT * FROM tasks ORDER BY created_at DESC LIMIT ?"
+            rows = self.db.execute_query(query, (limit,))
+            return [self._row_to_task(row) for row in rows]
+
+    def get_recent_tasks_summary(
+        self, limit: int = 5, description_length: int = 50
+    ) -> List[Tuple[str, str, str]]:
+        """Get (id, description prefix, status) tuples for the newest tasks.
+
+        A lightweight alternative to get_recent_tasks() for listings that
+        only display a few columns; no Task objects are built.
+        """
+        with self._task_lock:
+            query = """
+                SELECT id, substr(description, 1, ?), status FROM tasks
+                ORDER BY created_at DESC LIMIT ?
+            """
+            rows = self.db.execute_query(query, (description_length, limit))
+            return [tuple(row) for row in rows]
+
     def update_assigned_agent(self, task_id: str, agent_id: str) -> bool:
         """Update the agent assignment after spawn succeeds (thread-safe)."""
         with self._task_lock:
             query = "UPDATE tasks SET assigned_to = ? WHERE id = ?"
             return self.db.execute_update(query, (agent_id, task_id)) > 0
 
+    def start_tasks(self, assignments: List[Tuple[str, str]]) -> int:
+        """Record spawned agents and mark their tasks in progress in one transaction.
+
+        Each entry is a (task_id, agent_id) pair. Equivalent to calling
+        update_assigned_agent() followed by update_status(IN_PROGRESS) per task.
+        """
+        if not assignments:
+            return 0
+
+        with self._task_lock:
+            timestamp = datetime.now().isoformat()
+            query = """
+                UPDATE tasks SET assigned_to = ?, status = ?, assigned_at = ?
+                WHERE id = ?
+            """
+            params_seq = [
+                (agent_id, TaskStatus.IN_PROGRESS.value, timestamp, task_id)
+                for task_id, agent_id in assignments
+            ]
+            return self.db.execute_many(query, params_seq)
+
     def requeue_orphaned_tasks(
         self,
         active_agent_ids: Optional[Set[str]] = None,
@@ -278,6 +460,30 @@ class TaskQueue:
 
             return requeued
 
+    def requeue_tasks(self, failures: List[Tuple[str, str]]) -> int:
+        """Return (task_id, error) pairs to pending in one transaction.
+
+        Used when agents could not be started for claimed tasks: the
+        assignment is cleared and the reason kept in the task's error field.
+        Returns the number of tasks requeued.
+        """
+        if not failures:
+            return 0
+
+        with self._task_lock:
+            query = """
+                UPDATE tasks
+                SET status = ?, assigned_to = NULL, assigned_at = NULL, error = ?
+                WHERE id = ?
+            """
+            return self.db.execute_many(
+                query,
+                [
+                    (TaskStatus.PENDING.value, error, task_id)
+                    for task_id, error in failures
+                ],
+            )
+
     def _row_to_task(self, row) -> Task:
         """Convert database row to Task object"""
         return Task(
@@ -25,7 +25,11 @@ class Tool(ABC):
 
     @abstractmethod
     def execute(self, **kwargs) -> Any:
-        """Execute the tool with given arguments"""
+        """Execute the tool with given arguments.
+
+        Must be thread-safe: the harness runs tool calls from one batch
+        concurrently.
+        """
         raise NotImplementedError
 
 
@@ -244,9 +248,13 @@ class FileReadTool(Tool):
             except Exception as e:
                 return f"Error: Cannot resolve path - {str(e)}"
 
-            # Check if file exists
-            if not safe_path.exists():
+            # One stat covers both the existence and the size checks
+            try:
+                file_size = safe_path.stat().st_size
+            except FileNotFoundError:
                 return f"Error: File does not exist: {safe_path}"
+            except OSError as e:
+                return f"Error: Cannot check file size - {str(e)}"
 
             # Check for symlink attacks
             if safe_path.is_symlink():
@@ -259,14 +267,10 @@ class FileReadTool(Tool):
                     return "Error: Cannot resolve symlink safely"
 
             # Check file size before reading
-            try:
-                file_size = safe_path.stat().st_size
-                if file_size > MAX_READ_SIZE:
-                    size_mb = file_size / (1024 * 1024)
-                    max_mb = MAX_READ_SIZE / (1024 * 1024)
-                    return f"Error: File too large ({size_mb:.2f}MB). Maximum allowed size is {max_mb}MB. Use bash tool with 'head' or 'tail' for large files."
-            except OSError as e:
-                return f"Error: Cannot check file size - {str(e)}"
+            if file_size > MAX_READ_SIZE:
+                size_mb = file_size / (1024 * 1024)
+                max_mb = MAX_READ_SIZE / (1024 * 1024)
+                return f"Error: File too large ({size_mb:.2f}MB). Maximum allowed size is {max_mb}MB. Use bash tool with 'head' or 'tail' for large files."
 
             # Read file using safe operations
             content = FileOperations.safe_read_text(safe_path)
@@ -0,0 +1,160 @@
+"""Coverage for API-based agent execution helpers."""
+
+import contextlib
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.agent_api import AgentAPI, AgentTask, AgentType
+
+
+@pytest.fixture()
+def offline_api(tmp_path, monkeypatch):
+    """Provide an AgentAPI without credentials, so tasks run in demo mode."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    return AgentAPI(base_dir=str(tmp_path), db_path=str(tmp_path / "tasks.db"))
+
+
+def test_execute_tasks_returns_results_in_order(offline_api):
+    tasks = [
+        AgentTask(task_id=f"t{i}", description=f"task {i}", agent_type=agent_type)
+        for i, agent_type in enumerate([AgentType.BACKEND, AgentType.SPECS])
+    ]
+
+    results = offline_api.execute_tasks(tasks, max_concurrency=1)
+
+    assert "Backend Implementation Plan for: task 0" in results[0]
+    assert "Specifications for: task 1" in results[1]
+    assert all(task.status == "completed" for task in tasks)
+    assert offline_api.get_task_result("t1") == results[1]
+
+
+class _FakeMessages:
+    """Stand-in for client.messages that replies with a fixed JSON payload."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(self.answers))])
+
+    @contextlib.contextmanager
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        text = json.dumps(self.answers)
+        yield SimpleNamespace(text_stream=iter([text[:3], text[3:]]))
+
+
+def test_execute_batch_packs_same_type_tasks_into_one_request(offline_api):
+    messages = _FakeMessages({"a": "result a", "b": "result b"})
+    offline_api.client = SimpleNamespace(messages=messages)
+    tasks = [
+        AgentTask(task_id=task_id, description=task_id, agent_type=AgentType.BACKEND)
+        for task_id in ("a", "b", "c")
+    ]
+
+    results = offline_api.execute_batch(tasks)
+
+    assert len(messages.calls) == 2  # one batch, then "c" on its own
+    assert '"id": "c"' in messages.calls[0]["messages"][0]["content"]
+    assert results[:2] == ["result a", "result b"]
+    assert all(task.status == "completed" for task in tasks)
+    assert offline_api.get_task_result("b") == "result b"
+
+
+def test_model_and_token_budget_follow_agent_type(offline_api):
+    messages = _FakeMessages("ok")
+    offline_api.client = SimpleNamespace(messages=messages)
+
+    for task_id, agent_type in (("s", AgentType.SPECS), ("b", AgentType.BACKEND)):
+        offline_api.execute_task(
+            AgentTask(task_id=task_id, description=task_id, agent_type=agent_type)
+        )
+
+    specs_call, backend_call = messages.calls
+    assert "haiku" in specs_call["model"]
+    assert specs_call["max_tokens"] < backend_call["max_tokens"]
+
+
+def test_identical_prompts_are_served_from_response_cache(offline_api):
+    messages = _FakeMessages("fresh answer")
+    offline_api.client = SimpleNamespace(messages=messages)
+
+    def run():
+        task = AgentTask(task_id="t", description="same", agent_type=AgentType.SPECS)
+        return offline_api.execute_task(task)
+
+    assert run() == run() == '"fresh answer"'
+    assert len(messages.calls) == 1
+
+    offline_api.cache_ttl = 0
+    run()
+    assert len(messages.calls) == 2
+
+
+def test_unusable_cache_database_falls_through(tmp_path, monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    api = AgentAPI(base_dir=str(tmp_path), db_path=str(tmp_path / "missing" / "c.db"))
+    messages = _FakeMessages("answer")
+    api.client = SimpleNamespace(messages=messages)
+
+    task = AgentTask(task_id="t", description="same", agent_type=AgentType.SPECS)
+    assert api.execute_task(task) == '"answer"'
+    assert api.execute_task(task) == '"answer"'
+    assert len(messages.calls) == 2
+    api.close()
+
+
+def test_results_log_is_indexed_on_reopen(offline_api, tmp_path):
+    for description in ("first", "second"):
+        offline_api.execute_task(
+            AgentTask(task_id="t", description=description, agent_type=AgentType.SPECS)
+        )
+    offline_api.close()
+
+    reopened = AgentAPI(base_dir=str(tmp_path), db_path=str(tmp_path / "tasks.db"))
+
+    assert "Specifications for: second" in reopened.get_task_result("t")
+    assert reopened.get_task_result("missing") is None
+    reopened.close()
+
+
+def test_execute_task_streaming_yields_chunks_then_saves(offline_api):
+    offline_api.client = SimpleNamespace(messages=_FakeMessages("streamed"))
+    task = AgentTask(task_id="s", description="stream", agent_type=AgentType.BACKEND)
+
+    chunks = list(offline_api.execute_task_streaming(task))
+
+    assert chunks == ['"st', 'reamed"']
+    assert task.status == "completed"
+    assert offline_api.get_task_result("s") == '"streamed"'
+
+
+def test_results_log_is_shared_between_instances(offline_api, tmp_path):
+    other = AgentAPI(base_dir=str(tmp_path), db_path=str(tmp_path / "tasks.db"))
+
+    for api, task_id in ((offline_api, "t1"), (other, "t2"), (offline_api, "t3")):
+        api.execute_task(
+            AgentTask(task_id=task_id, description=task_id, agent_type=AgentType.SPECS)
+        )
+
+    for api in (offline_api, other):
+        for task_id in ("t1", "t2", "t3"):
+            assert f"Specifications for: {task_id}" in api.get_task_result(task_id)
+
+    offline_api.close()
+    offline_api.execute_task(
+        AgentTask(task_id="t4", description="t4", agent_type=AgentType.SPECS)
+    )
+    assert "Specifications for: t4" in other.get_task_result("t4")
+    other.close()
+    offline_api.close()
@@ -0,0 +1,182 @@
+"""Completion wakeups from the agent spawner."""
+
+import asyncio
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.agent_spawner import AgentSpawner, AgentType
+
+
+def _use_gemini_fallback(monkeypatch):
+    original_which = shutil.which
+
+    def fake_which(name: str):
+        return None if name == "gemini" else original_which(name)
+
+    monkeypatch.setattr("src.core.agent_spawner.shutil.which", fake_which)
+
+
+def _wait_for_exit(spawner: AgentSpawner, agent_id: str, timeout: float = 10) -> str:
+    async def wait():
+        return await asyncio.wait_for(spawner.wait_for_exit(agent_id), timeout=timeout)
+
+    return asyncio.run(wait())
+
+
+def test_wait_for_exit_wakes_on_agent_exit(tmp_path, monkeypatch):
+    """A finished agent should wake the waiter well before the timeout."""
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    _use_gemini_fallback(monkeypatch)
+
+    agent_id = spawner.spawn_agent(AgentType.GEMINI, "wake123", "Say hello")
+
+    assert _wait_for_exit(spawner, agent_id) == agent_id
+    status = spawner.get_agent_status(agent_id)
+    assert status is not None
+    assert not status["running"]
+
+    spawner.cleanup_all()
+
+
+def test_wait_for_exit_resolves_after_status_recorded(tmp_path, monkeypatch):
+    """The exit future should only resolve once the final status is known."""
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    _use_gemini_fallback(monkeypatch)
+
+    agent_id = spawner.spawn_agent(AgentType.GEMINI, "exit123", "Say hello")
+
+    async def wait():
+        return await asyncio.wait_for(spawner.wait_for_exit(agent_id), timeout=10)
+
+    assert asyncio.run(wait()) == agent_id
+    assert spawner.get_agent_status(agent_id)["status"] == "completed"
+
+    # Waiting on an agent that already exited resolves immediately
+    assert asyncio.run(wait()) == agent_id
+
+    spawner.cleanup_all()
+
+
+def test_claude_prompt_is_piped_on_stdin(tmp_path, monkeypatch):
+    """The Claude CLI should receive its prompt on stdin, not in argv."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_claude = bin_dir / "claude"
+    fake_claude.write_text('#!/bin/sh\necho "args: $*"\ncat\n')
+    fake_claude.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    agent_id = spawner.spawn_agent(AgentType.CLAUDE, "stdin123", "Say hello")
+
+    assert _wait_for_exit(spawner, agent_id) == agent_id
+    output = spawner.get_agent_output(agent_id)
+    assert "args: --dangerously-skip-permissions -p\n" in output
+    assert "Task: Say hello" in output
+
+    spawner.cleanup_all()
+
+
+def test_single_reaper_thread_serves_all_agents(tmp_path, monkeypatch):
+    """Agents should share one reaper thread rather than one thread each."""
+    if not hasattr(os, "pidfd_open"):
+        pytest.skip("pidfd not available")
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    _use_gemini_fallback(monkeypatch)
+
+    agent_ids = [
+        spawner.spawn_agent(AgentType.GEMINI, f"reap{i}", "Say hello") for i in range(3)
+    ]
+
+    async def wait_all():
+        await asyncio.wait_for(
+            asyncio.gather(*(spawner.wait_for_exit(a) for a in agent_ids)), timeout=10
+        )
+
+    asyncio.run(wait_all())
+    assert all(spawner.get_agent_status(a)["status"] == "completed" for a in agent_ids)
+    reaper = spawner._reaper_thread
+    assert reaper is not None
+
+    spawner.cleanup_all()
+    reaper.join(timeout=5)
+    assert not reaper.is_alive()
+
+
+def test_exit_record_carries_output_summary(tmp_path, monkeypatch):
+    """Queued exit records should summarize output instead of copying it."""
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    _use_gemini_fallback(monkeypatch)
+
+    agent_id = spawner.spawn_agent(AgentType.GEMINI, "summary123", "Say hello")
+
+    record = spawner.get_output(timeout=10)
+    output = spawner.get_agent_output(agent_id)
+    assert record["agent_id"] == agent_id
+    assert record["output_size"] == len(output.encode("utf-8"))
+    assert record["output_head"] == output
+    assert "output" not in record
+    assert spawner.get_output(timeout=0.01) is None
+
+    spawner.cleanup_all()
+
+
+def test_cleanup_frees_working_dir_immediately(tmp_path, monkeypatch):
+    """Cleanup should free the working directory path without waiting."""
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    _use_gemini_fallback(monkeypatch)
+
+    agent_id = spawner.spawn_agent(AgentType.GEMINI, "trash123", "Say hello")
+    assert _wait_for_exit(spawner, agent_id) == agent_id
+    working_dir = Path(spawner.agents[agent_id].working_dir)
+
+    spawner.cleanup_agent(agent_id)
+    assert not working_dir.exists()
+
+    spawner._trash_executor.shutdown(wait=True)
+    assert list((tmp_path / "agents").iterdir()) == []
+
+    spawner.cleanup_all()
+
+
+def test_cleanup_all_reaps_killed_agents_and_allows_respawn(tmp_path, monkeypatch):
+    """Agents killed by cleanup_all() resolve their waiters; spawning still works."""
+    if not hasattr(os, "pidfd_open"):
+        pytest.skip("pidfd not available")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_claude = bin_dir / "claude"
+    fake_claude.write_text("#!/bin/sh\nexec sleep 30\n")
+    fake_claude.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    spawner = AgentSpawner(base_dir=str(tmp_path / "agents"))
+    agent_id = spawner.spawn_agent(AgentType.CLAUDE, "slow123", "Say hello")
+
+    async def kill_while_waiting():
+        waiter = asyncio.ensure_future(spawner.wait_for_exit(agent_id))
+        await asyncio.to_thread(spawner.cleanup_all)
+        return await asyncio.wait_for(waiter, timeout=5)
+
+    assert asyncio.run(kill_while_waiting()) == agent_id
+    assert spawner._reaper_thread is None
+
+    _use_gemini_fallback(monkeypatch)
+    agent_id = spawner.spawn_agent(AgentType.GEMINI, "again123", "Say hello")
+
+    async def wait():
+        return await asyncio.wait_for(spawner.wait_for_exit(agent_id), timeout=10)
+
+    assert asyncio.run(wait()) == agent_id
+    assert spawner.get_agent_status(agent_id)["status"] == "completed"
+
+    spawner.cleanup_all()
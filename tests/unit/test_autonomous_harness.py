@@ -0,0 +1,151 @@
+"""Context pruning and subtask pooling in the autonomous harness."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import autonomous_harness
+from src.core.autonomous_harness import AutonomousHarness, ParallelAutonomousHarness
+
+
+class _StubAPI:
+    """Answers every step with bulky text and a tool call, until the last."""
+
+    def __init__(self, steps: int):
+        self.steps = steps
+        self.calls = 0
+
+    def chat_completion(self, messages, tools):
+        self.calls += 1
+        if self.calls >= self.steps:
+            return {"role": "assistant", "content": [{"type": "text", "text": "done"}]}
+        return {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"step {self.calls} " + "x" * 3000},
+                {
+                    "type": "tool_use",
+                    "id": f"tool-{self.calls}",
+                    "name": "missing_tool",
+                    "input": {},
+                },
+            ],
+        }
+
+
+def _assert_tool_results_follow_their_calls(messages):
+    for i, msg in enumerate(messages):
+        if not AutonomousHarness._has_tool_results(msg):
+            continue
+        previous = messages[i - 1]
+        assert i > 0 and previous["role"] == "assistant"
+        call_ids = {b["id"] for b in previous["content"] if b.get("type") == "tool_use"}
+        for block in msg["content"]:
+            assert block["tool_use_id"] in call_ids
+
+
+@pytest.fixture()
+def harness(monkeypatch):
+    settings = dict(autonomous_harness.SETTINGS)
+    settings.update(
+        {
+            "context_pruning_threshold_chars": 20000,
+            "context_sink_messages": 2,
+            "context_window_messages": 6,
+        }
+    )
+    settings.pop("stable_prefix_chars", None)
+    monkeypatch.setattr(autonomous_harness, "SETTINGS", settings)
+    harness = AutonomousHarness(_StubAPI(steps=40))
+    yield harness
+    harness.close()
+
+
+def test_pruning_keeps_bookkeeping_prefix_window_and_tool_pairs(harness):
+    prunes = []
+    prefix = []
+    original_prune = harness._prune_context
+
+    def checked_prune():
+        window = list(harness.messages[-6:])
+        before = len(harness.messages)
+        original_prune()
+        messages = harness.messages
+
+        assert harness._total_chars == sum(harness._msg_sizes)
+        assert len(harness._msg_sizes) == len(messages)
+        _assert_tool_results_follow_their_calls(messages)
+
+        if len(messages) < before:
+            prunes.append(before - len(messages))
+            assert all(a is b for a, b in zip(messages[-6:], window))
+            kept = messages[: harness._prefix_len]
+            if not prefix:
+                prefix.extend(kept)
+            assert len(kept) == len(prefix) >= 2
+            assert all(a is b for a, b in zip(kept, prefix))
+
+    harness._prune_context = checked_prune
+    result = harness.run_task("prune me", max_steps=50)
+
+    assert result["completed"]
+    assert len(prunes) >= 2
+    assert harness._total_chars == sum(harness._msg_sizes)
+    assert harness.messages[0]["content"].startswith("You are an autonomous")
+
+
+def test_parallel_close_releases_borrowed_harnesses_and_fails_waiters():
+    parallel = ParallelAutonomousHarness(_StubAPI(steps=1), max_parallel_agents=2)
+    borrowed = [parallel._harness_pool.get() for _ in range(2)]
+    waiter = ThreadPoolExecutor(max_workers=1).submit(
+        parallel._run_subtask, "never runs", 5
+    )
+
+    parallel.close()
+
+    with pytest.raises(RuntimeError):
+        waiter.result(timeout=5)
+    for harness in borrowed:
+        assert all(pool._shutdown for pool in harness._pools.values())
+
+
+def test_pruning_without_recent_window_survives_oversized_prefix(harness, monkeypatch):
+    monkeypatch.setitem(autonomous_harness.SETTINGS, "context_window_messages", 0)
+
+    result = harness.run_task("y" * 12000, max_steps=50)
+
+    assert result["completed"]
+    assert harness._total_chars == sum(harness._msg_sizes)
+    _assert_tool_results_follow_their_calls(harness.messages)
+
+
+def test_oversized_tool_results_are_summarized_once(harness):
+    # Enough error lines to fill the summary's middle, as real failures do
+    output = "line\n" * 6000 + "Traceback: boom\n" * 50 + "line\n" * 6000
+    harness._append_message({"role": "user", "content": "task"})
+    harness._append_message(
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": "t1", "content": output},
+                # Keeps the message oversized after the result is summarized
+                {"type": "text", "text": "z" * 60000},
+            ],
+        }
+    )
+
+    harness._prune_context()
+    blocks = harness.messages[1]["content"]
+    summaries = [block["content"] for block in blocks if "content" in block]
+    assert all("Traceback: boom" in text for text in summaries)
+    assert all(len(text) < len(output) for text in summaries)
+
+    harness._prune_context()
+    assert [b["content"] for b in blocks if "content" in b] == summaries
+    assert harness._total_chars == sum(harness._msg_sizes)
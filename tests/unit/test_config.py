@@ -0,0 +1,24 @@
+"""update_config keeps explicit values and only recomputes derived paths."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import config as config_module
+
+
+def test_update_config_does_not_reread_environment(monkeypatch):
+    cfg = config_module.OrchestratorConfig(base_dir="/tmp/orch-test")
+    monkeypatch.setattr(config_module, "config", cfg)
+    monkeypatch.setenv("MAX_AGENTS", "9")
+    monkeypatch.setenv("USE_API_MODE", "false")
+
+    updated = config_module.update_config(max_agents=5, use_api_mode=True)
+
+    assert updated is cfg
+    assert cfg.max_agents == 5
+    assert cfg.use_api_mode is True
+    assert cfg.context_dir == "/tmp/orch-test/context"
@@ -0,0 +1,44 @@
+"""JSON helpers behave the same with and without orjson."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_round_trip_and_indent(backend):
+    data = {"name": "task", "values": [1, 2.5, None], "nested": {"ok": True}}
+
+    assert json_utils.loads(json_utils.dumps(data)) == data
+    assert json_utils.loads(json_utils.dumps_bytes(data)) == data
+    assert json_utils.dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+
+
+def test_sort_keys(backend):
+    data = {"b": 1, "a": {"d": 2, "c": 3}}
+
+    assert json_utils.dumps(data, sort_keys=True) == json_utils.dumps(
+        {"a": {"c": 3, "d": 2}, "b": 1}
+    )
+    assert json_utils.dumps_bytes(data, sort_keys=True).startswith(b'{"a"')
+
+
+def test_malformed_input_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("{not json")
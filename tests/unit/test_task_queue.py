@@ -0,0 +1,128 @@
+"""Coverage for task queue batch and lookup helpers."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.task_queue import Priority, TaskQueue, TaskStatus
+
+
+@pytest.fixture()
+def temp_queue():
+    """Provide a task queue backed by a temporary SQLite file."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as handle:
+        db_path = handle.name
+    try:
+        queue = TaskQueue(db_path=db_path)
+        yield queue
+    finally:
+        try:
+            os.unlink(db_path)
+        except FileNotFoundError:
+            pass
+
+
+def test_update_statuses_applies_batch(temp_queue):
+    done_id = temp_queue.add_task("done", agent_type="claude")
+    failed_id = temp_queue.add_task("broken", agent_type="claude")
+
+    updated = temp_queue.update_statuses(
+        [
+            (done_id, TaskStatus.COMPLETED, "all good", None),
+            (failed_id, TaskStatus.FAILED, None, "Agent failed"),
+        ]
+    )
+    assert updated == 2
+
+    done = temp_queue.get_task(done_id)
+    assert done.status == TaskStatus.COMPLETED.value
+    assert done.result == "all good"
+    assert done.completed_at
+
+    failed = temp_queue.get_task(failed_id)
+    assert failed.status == TaskStatus.FAILED.value
+    assert failed.error == "Agent failed"
+    assert failed.result is None
+
+
+def test_update_statuses_empty_batch_is_noop(temp_queue):
+    assert temp_queue.update_statuses([]) == 0
+
+
+def test_add_tasks_inserts_batch(temp_queue):
+    task_ids = temp_queue.add_tasks(
+        [
+            ("first", "claude", Priority.HIGH, None),
+            ("second", "codex", Priority.LOW, {"key": "value"}),
+        ]
+    )
+
+    assert len(task_ids) == 2
+    first = temp_queue.get_task(task_ids[0])
+    second = temp_queue.get_task(task_ids[1])
+    assert first.description == "first"
+    assert first.priority == Priority.HIGH.value
+    assert second.agent_type == "codex"
+    assert second.context == {"key": "value"}
+
+
+def test_start_tasks_marks_in_progress(temp_queue):
+    task_id = temp_queue.add_task("spawned", agent_type="claude")
+    assert temp_queue.assign_task(task_id, "claude-agent")
+
+    assert temp_queue.start_tasks([(task_id, "claude-1234")]) == 1
+
+    task = temp_queue.get_task(task_id)
+    assert task.status == TaskStatus.IN_PROGRESS.value
+    assert task.assigned_to == "claude-1234"
+    assert task.assigned_at
+
+
+def test_pending_counts_groups_by_agent_type(temp_queue):
+    temp_queue.add_task("one", agent_type="claude")
+    temp_queue.add_task("two", agent_type="claude")
+    assigned_id = temp_queue.add_task("three", agent_type="codex")
+    temp_queue.add_task("four", agent_type="any")
+    temp_queue.assign_task(assigned_id, "codex-agent")
+
+    assert temp_queue.pending_counts() == {"claude": 2, "any": 1}
+
+
+def test_requeue_tasks_clears_assignment_and_records_error(temp_queue):
+    task_id = temp_queue.add_task("unspawnable", agent_type="claude")
+    temp_queue.pick_next_batch(1, ("claude",))
+
+    assert temp_queue.requeue_tasks([(task_id, "Spawn failed: boom")]) == 1
+
+    task = temp_queue.get_task(task_id)
+    assert task.status == TaskStatus.PENDING.value
+    assert task.assigned_to is None
+    assert task.error == "Spawn failed: boom"
+    assert temp_queue.requeue_tasks([]) == 0
+
+
+def test_get_recent_tasks_limits_rows(temp_queue):
+    for i in range(4):
+        temp_queue.add_task(f"task {i}")
+
+    recent = temp_queue.get_recent_tasks(2)
+
+    assert len(recent) == 2
+    assert [task.id for task in recent] == [
+        task.id for task in temp_queue.get_all_tasks()[:2]
+    ]
+
+
+def test_get_recent_tasks_summary_returns_tuples(temp_queue):
+    task_id = temp_queue.add_task("x" * 80)
+
+    assert temp_queue.get_recent_tasks_summary(5) == [
+        (task_id, "x" * 50, TaskStatus.PENDING.value)
+    ]